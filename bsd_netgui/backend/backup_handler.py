@@ -27,6 +27,7 @@ class BackupMetadata:
         self.user: str = ""
         self.hostname: str = ""
         self.snapshot_name: Optional[str] = None
+        self.backup_id: Optional[str] = None  # Identifier for restore/delete
     
     def to_dict(self) -> Dict:
         """Convert to dictionary."""
@@ -51,6 +52,8 @@ class BackupMetadata:
         metadata.user = data.get('user', '')
         metadata.hostname = data.get('hostname', '')
         metadata.snapshot_name = data.get('snapshot_name')
+        if metadata.method == 'zfs' and metadata.snapshot_name:
+            metadata.backup_id = metadata.snapshot_name
         return metadata
 
 
@@ -286,7 +289,10 @@ class BackupHandler:
                         if metadata_path.exists():
                             with open(metadata_path, 'r') as f:
                                 data = json.load(f)
-                            backups.append(BackupMetadata.from_dict(data))
+                            metadata = BackupMetadata.from_dict(data)
+                            # File backups are identified by their directory name
+                            metadata.backup_id = item.name
+                            backups.append(metadata)
                     elif item.suffix == '.json' and item.name.startswith('snapshot-'):
                         # ZFS snapshot metadata
                         with open(item, 'r') as f:
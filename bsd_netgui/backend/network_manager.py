@@ -1,13 +1,27 @@
 """Main network manager that coordinates all backend handlers."""
 
+import time
 import logging
-from typing import Dict, Any
+import threading
+import concurrent.futures
+from typing import Dict, Any, List, NamedTuple
 from .interface_handler import InterfaceHandler
 from .wifi_handler import WiFiHandler
 from .dns_handler import DNSHandler
 from .routing_handler import RoutingHandler
 
 
+class IfaceRow(NamedTuple):
+    """One interface as listed by NetworkManager.list_interfaces()."""
+    
+    name: str
+    status: str
+    ipv4: str
+    mac: str
+    mtu: str
+    netmask: str = ''
+
+
 class NetworkManager:
     """
     Main network manager coordinator using Singleton pattern.
@@ -41,6 +55,13 @@ class NetworkManager:
             self.dns_handler = DNSHandler()
             self.routing_handler = RoutingHandler()
             
+            # Last list_interfaces() result as (monotonic timestamp, interfaces)
+            self._iface_cache = None
+            self._iface_cache_lock = threading.Lock()
+            
+            # Bumped on invalidation so listings started earlier are not cached
+            self._iface_cache_gen = 0
+            
             self._initialized = True
             self.logger.info("NetworkManager initialized successfully")
         except Exception as e:
@@ -75,6 +96,38 @@ class NetworkManager:
                 'routes': []
             }
     
+    def snapshot(self, max_age: float = 0.0) -> Dict[str, Any]:
+        """
+        Collect interfaces, WiFi interfaces, DNS servers and routes at once.
+        
+        The four queries are independent and run concurrently.
+        
+        Args:
+            max_age: Maximum age in seconds of a reused interface listing
+        
+        Returns:
+            Dictionary with keys interfaces, wifi, dns and routes; a value
+            is None if collecting it failed
+        """
+        collectors = {
+            'interfaces': lambda: self.list_interfaces(max_age=max_age),
+            'wifi': self.wifi_handler.get_wifi_interfaces,
+            'dns': self.dns_handler.get_dns_servers,
+            'routes': self.routing_handler.get_routing_table,
+        }
+        
+        snap = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(collectors)) as executor:
+            futures = {key: executor.submit(fn) for key, fn in collectors.items()}
+            for key, future in futures.items():
+                try:
+                    snap[key] = future.result()
+                except Exception as e:
+                    self.logger.error(f"Error collecting {key} for snapshot: {str(e)}")
+                    snap[key] = None
+        
+        return snap
+    
     def refresh_all(self) -> bool:
         """
         Refresh all network information.
@@ -91,9 +144,45 @@ class NetworkManager:
             return False
     
     # Interface operations
-    def list_interfaces(self):
-        """Get all network interfaces."""
-        return self.interface_handler.list_interfaces()
+    def list_interfaces(self, max_age: float = 0.0) -> List[IfaceRow]:
+        """
+        Get all network interfaces.
+        
+        Args:
+            max_age: Reuse a previous result if it is at most this many
+                seconds old; 0 always queries the system
+        
+        Returns:
+            List of IfaceRow tuples, with empty strings for missing fields
+        """
+        with self._iface_cache_lock:
+            cached = self._iface_cache
+            if max_age > 0 and cached and time.monotonic() - cached[0] <= max_age:
+                return list(cached[1])
+            gen = self._iface_cache_gen
+        
+        interfaces = [
+            IfaceRow(
+                iface['name'],
+                iface['status'],
+                iface.get('ipv4', ''),
+                iface.get('mac', ''),
+                str(iface.get('mtu', '')),
+                iface.get('netmask', '')
+            )
+            for iface in self.interface_handler.list_interfaces()
+        ]
+        
+        with self._iface_cache_lock:
+            if gen == self._iface_cache_gen:
+                self._iface_cache = (time.monotonic(), interfaces)
+        return list(interfaces)
+    
+    def invalidate_interface_cache(self):
+        """Discard the cached interface list so the next call re-queries."""
+        with self._iface_cache_lock:
+            self._iface_cache = None
+            self._iface_cache_gen += 1
     
     def get_interface_details(self, iface: str):
         """Get details for a specific interface."""
@@ -101,19 +190,32 @@ class NetworkManager:
     
     def enable_interface(self, iface: str):
         """Enable a network interface."""
-        return self.interface_handler.enable_interface(iface)
+        try:
+            return self.interface_handler.enable_interface(iface)
+        finally:
+            # After the change, so a concurrent listing cannot cache old data
+            self.invalidate_interface_cache()
     
     def disable_interface(self, iface: str):
         """Disable a network interface."""
-        return self.interface_handler.disable_interface(iface)
+        try:
+            return self.interface_handler.disable_interface(iface)
+        finally:
+            self.invalidate_interface_cache()
     
     def configure_dhcp(self, iface: str):
         """Configure interface to use DHCP."""
-        return self.interface_handler.configure_dhcp(iface)
+        try:
+            return self.interface_handler.configure_dhcp(iface)
+        finally:
+            self.invalidate_interface_cache()
     
     def configure_static_ip(self, iface: str, ip: str, netmask: str, gateway: str = None):
         """Configure interface with static IP."""
-        return self.interface_handler.configure_static_ip(iface, ip, netmask, gateway)
+        try:
+            return self.interface_handler.configure_static_ip(iface, ip, netmask, gateway)
+        finally:
+            self.invalidate_interface_cache()
     
     # WiFi operations
     def get_wifi_interfaces(self):
@@ -4,13 +4,54 @@ This module provides a profile abstraction layer that combines rc.conf
 and wpa_supplicant.conf settings into reusable network profiles.
 """
 
+import os
 import json
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 from .rc_conf_handler import RCConfHandler
 from .wpa_conf_handler import WPAConfHandler
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _read_json(path) -> Any:
+    """
+    Read a JSON file, using orjson when it is installed.
+    
+    Args:
+        path: File to read
+    
+    Returns:
+        Decoded JSON data
+    """
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _write_json(path, data: Any):
+    """
+    Write data to a JSON file, using orjson when it is installed.
+    
+    Args:
+        path: File to write
+        data: JSON-serializable data
+    """
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+
 
 class NetworkProfile:
     """Represents a network configuration profile."""
@@ -127,6 +168,9 @@ class ProfileManager:
         }
     }
     
+    # Template names in TEMPLATES order, filled by get_available_templates()
+    _templates_cache: Optional[Tuple[str, ...]] = None
+    
     def __init__(self, 
                  rc_conf_path: str = "/etc/rc.conf",
                  wpa_conf_path: str = "/etc/wpa_supplicant.conf",
@@ -152,6 +196,12 @@ class ProfileManager:
         
         self.profiles: List[NetworkProfile] = []
         self._loaded = False
+        
+        # Loaded profiles by name, for get_profile()
+        self._by_name: Dict[str, NetworkProfile] = {}
+        
+        # Parsed profile files: {path: (st_mtime_ns, profile)}
+        self._cache: Dict[str, Tuple[int, NetworkProfile]] = {}
     
     def load_profiles(self) -> bool:
         """
@@ -161,24 +211,40 @@ class ProfileManager:
             True if successful
         """
         try:
-            self.profiles = []
+            # Build the new list privately so readers never see it half-filled
+            profiles = []
             
             if not self.profiles_dir.exists():
                 self.logger.warning(f"Profiles directory does not exist: {self.profiles_dir}")
+                self._set_profiles(profiles)
                 self._loaded = True
                 return True
             
-            # Load all JSON files from profiles directory
-            for profile_file in self.profiles_dir.glob('*.json'):
-                try:
-                    with open(profile_file, 'r') as f:
-                        data = json.load(f)
-                    profile = NetworkProfile.from_dict(data)
-                    self.profiles.append(profile)
-                    self.logger.debug(f"Loaded profile: {profile.name}")
-                except Exception as e:
-                    self.logger.error(f"Error loading profile {profile_file}: {e}")
+            # Load all JSON files from profiles directory, re-parsing only
+            # files that changed since they were last read
+            cache = {}
+            with os.scandir(self.profiles_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('.json') or not entry.is_file():
+                        continue
+                    
+                    try:
+                        mtime = entry.stat().st_mtime_ns
+                        cached = self._cache.get(entry.path)
+                        if cached and cached[0] == mtime:
+                            profile = cached[1]
+                        else:
+                            data = _read_json(entry.path)
+                            profile = NetworkProfile.from_dict(data)
+                            self.logger.debug(f"Loaded profile: {profile.name}")
+                        
+                        cache[entry.path] = (mtime, profile)
+                        profiles.append(profile)
+                    except Exception as e:
+                        self.logger.error(f"Error loading profile {entry.path}: {e}")
             
+            self._cache = cache
+            self._set_profiles(profiles)
             self.logger.info(f"Loaded {len(self.profiles)} profiles")
             self._loaded = True
             return True
@@ -186,6 +252,32 @@ class ProfileManager:
             self.logger.error(f"Error loading profiles: {e}")
             return False
     
+    def _set_profiles(self, profiles: List[NetworkProfile]):
+        """
+        Replace the loaded profiles and their name index.
+        
+        Args:
+            profiles: Loaded profiles
+        """
+        # Reversed so the first profile with a given name wins, as before
+        self._by_name = {profile.name: profile for profile in reversed(profiles)}
+        self.profiles = profiles
+    
+    def _profile_path(self, profile_name: str) -> Path:
+        """
+        Get the file a profile is stored in.
+        
+        Args:
+            profile_name: Profile name
+        
+        Returns:
+            Path of the profile's JSON file
+        """
+        # Sanitize filename
+        filename = profile_name.lower().replace(' ', '_').replace('/', '_')
+        filename = ''.join(c for c in filename if c.isalnum() or c in ('_', '-'))
+        return self.profiles_dir / f"{filename}.json"
+    
     def save_profile(self, profile: NetworkProfile) -> bool:
         """
         Save a profile to disk.
@@ -197,14 +289,10 @@ class ProfileManager:
             True if successful
         """
         try:
-            # Sanitize filename
-            filename = profile.name.lower().replace(' ', '_').replace('/', '_')
-            filename = ''.join(c for c in filename if c.isalnum() or c in ('_', '-'))
-            profile_file = self.profiles_dir / f"{filename}.json"
+            profile_file = self._profile_path(profile.name)
             
             # Write profile as JSON
-            with open(profile_file, 'w') as f:
-                json.dump(profile.to_dict(), f, indent=2)
+            _write_json(profile_file, profile.to_dict())
             
             self.logger.info(f"Saved profile: {profile.name} to {profile_file}")
             return True
@@ -224,16 +312,14 @@ class ProfileManager:
         """
         try:
             # Find profile file
-            filename = profile_name.lower().replace(' ', '_').replace('/', '_')
-            filename = ''.join(c for c in filename if c.isalnum() or c in ('_', '-'))
-            profile_file = self.profiles_dir / f"{filename}.json"
+            profile_file = self._profile_path(profile_name)
             
             if profile_file.exists():
                 profile_file.unlink()
                 self.logger.info(f"Deleted profile: {profile_name}")
                 
                 # Remove from loaded profiles
-                self.profiles = [p for p in self.profiles if p.name != profile_name]
+                self._set_profiles([p for p in self.profiles if p.name != profile_name])
                 return True
             
             self.logger.warning(f"Profile file not found: {profile_file}")
@@ -242,6 +328,50 @@ class ProfileManager:
             self.logger.error(f"Error deleting profile {profile_name}: {e}")
             return False
     
+    def rename_profile(self, old_name: str, profile: NetworkProfile) -> bool:
+        """
+        Save a profile under a new name, replacing its old file.
+        
+        Args:
+            old_name: Name the profile was saved under
+            profile: Updated profile carrying the new name
+        
+        Returns:
+            True if successful
+        """
+        try:
+            old_file = self._profile_path(old_name)
+            new_file = self._profile_path(profile.name)
+            
+            if new_file != old_file and new_file.exists():
+                self.logger.warning(
+                    f"Cannot rename profile {old_name}: {new_file} already exists"
+                )
+                return False
+            
+            # Write the new file completely before swapping it in and only
+            # then remove the old one, so a complete copy of the profile is
+            # on disk at every point
+            tmp_file = new_file.with_name(new_file.name + '.tmp')
+            try:
+                _write_json(tmp_file, profile.to_dict())
+                os.replace(tmp_file, new_file)
+            except Exception:
+                tmp_file.unlink(missing_ok=True)
+                raise
+            
+            if new_file != old_file and old_file.exists():
+                old_file.unlink()
+            
+            self._cache.pop(str(old_file), None)
+            self._set_profiles([p for p in self.profiles if p.name != old_name])
+            
+            self.logger.info(f"Renamed profile: {old_name} to {profile.name}")
+            return True
+        except Exception as e:
+            self.logger.error(f"Error renaming profile {old_name}: {e}")
+            return False
+    
     def get_profile(self, profile_name: str) -> Optional[NetworkProfile]:
         """
         Get a profile by name.
@@ -252,10 +382,7 @@ class ProfileManager:
         Returns:
             NetworkProfile or None
         """
-        for profile in self.profiles:
-            if profile.name == profile_name:
-                return profile
-        return None
+        return self._by_name.get(profile_name)
     
     def list_profiles(self) -> List[NetworkProfile]:
         """
@@ -449,8 +576,7 @@ class ProfileManager:
             True if successful
         """
         try:
-            with open(export_path, 'w') as f:
-                json.dump(profile.to_dict(), f, indent=2)
+            _write_json(export_path, profile.to_dict())
             
             self.logger.info(f"Exported profile {profile.name} to {export_path}")
             return True
@@ -469,8 +595,7 @@ class ProfileManager:
             NetworkProfile or None if import failed
         """
         try:
-            with open(import_path, 'r') as f:
-                data = json.load(f)
+            data = _read_json(import_path)
             
             profile = NetworkProfile.from_dict(data)
             self.logger.info(f"Imported profile: {profile.name}")
@@ -511,7 +636,9 @@ class ProfileManager:
         Returns:
             List of template names
         """
-        return list(cls.TEMPLATES.keys())
+        if cls._templates_cache is None:
+            cls._templates_cache = tuple(cls.TEMPLATES)
+        return list(cls._templates_cache)
     
     @classmethod
     def get_template_info(cls, template_name: str) -> Optional[Dict[str, Any]]:
@@ -0,0 +1,136 @@
+"""Routing socket monitor for interface change notifications on FreeBSD."""
+
+import sys
+import socket
+import struct
+import logging
+import threading
+from typing import Callable
+
+
+class RouteMonitor:
+    """
+    Watches the kernel routing socket for interface changes.
+    
+    FreeBSD announces link state, address and interface arrival/departure
+    changes as messages on PF_ROUTE sockets. This class reads them in a
+    daemon thread and invokes a callback for each relevant message, so
+    callers can react to real changes instead of polling ifconfig.
+    """
+    
+    # rt_msghdr message types from FreeBSD <net/route.h>
+    RTM_NEWADDR = 0xc
+    RTM_DELADDR = 0xd
+    RTM_IFINFO = 0xe
+    RTM_IFANNOUNCE = 0x11
+    
+    INTERFACE_EVENTS = frozenset((RTM_NEWADDR, RTM_DELADDR, RTM_IFINFO, RTM_IFANNOUNCE))
+    
+    # Leading rtm_msglen, rtm_version and rtm_type fields shared by all messages
+    _HEADER = struct.Struct("=HBB")
+    
+    def __init__(self, callback: Callable[[], None]):
+        """
+        Initialize the RouteMonitor.
+        
+        Args:
+            callback: Called from the monitor thread on each interface event
+        """
+        self.logger = logging.getLogger(__name__)
+        self.callback = callback
+        self._sock = None
+        self._thread = None
+    
+    @staticmethod
+    def is_supported() -> bool:
+        """
+        Check whether routing sockets are available on this platform.
+        
+        Returns:
+            True on BSD systems providing AF_ROUTE, False otherwise
+        """
+        # On Linux AF_ROUTE is an alias for AF_NETLINK, which speaks a
+        # different protocol
+        return 'bsd' in sys.platform and hasattr(socket, 'AF_ROUTE')
+    
+    def start(self) -> bool:
+        """
+        Open the routing socket and start the monitor thread.
+        
+        Returns:
+            True if monitoring started, False otherwise
+        """
+        if self._thread is not None:
+            return True
+        
+        if not self.is_supported():
+            self.logger.debug("Routing socket monitoring not supported on this platform")
+            return False
+        
+        try:
+            self._sock = socket.socket(socket.AF_ROUTE, socket.SOCK_RAW, 0)
+            # Wake up periodically so stop() is noticed even without traffic
+            self._sock.settimeout(1.0)
+        except OSError as e:
+            self.logger.warning(f"Unable to open routing socket: {e}")
+            return False
+        
+        self._thread = threading.Thread(target=self._run, name="route-monitor")
+        self._thread.daemon = True
+        self._thread.start()
+        self.logger.info("Monitoring routing socket for interface changes")
+        return True
+    
+    def stop(self):
+        """Stop monitoring and close the routing socket."""
+        sock, self._sock = self._sock, None
+        self._thread = None
+        
+        if sock is not None:
+            try:
+                sock.close()
+            except OSError:
+                pass
+    
+    def _run(self):
+        """Read routing messages until the socket is closed."""
+        sock = self._sock
+        
+        while self._sock is sock:
+            try:
+                data = sock.recv(2048)
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            
+            if not data:
+                break
+            
+            if self.is_interface_event(data):
+                try:
+                    self.callback()
+                except Exception as e:
+                    self.logger.error(f"Error handling routing socket event: {e}")
+    
+    @classmethod
+    def is_interface_event(cls, data: bytes) -> bool:
+        """
+        Check whether a routing message reports an interface change.
+        
+        Args:
+            data: Raw routing socket message
+        
+        Returns:
+            True for address, link state and interface arrival/departure messages
+        """
+        if len(data) < cls._HEADER.size:
+            return False
+        
+        msglen, version, msg_type = cls._HEADER.unpack_from(data)
+        
+        # Ignore messages cut short by the read buffer or with a bogus length
+        if msglen < cls._HEADER.size or msglen > len(data):
+            return False
+        
+        return msg_type in cls.INTERFACE_EVENTS
@@ -3,6 +3,7 @@
 import re
 import logging
 import os
+import subprocess
 from typing import List, Dict, Optional
 from ..utils.system_utils import execute_command
 
@@ -64,12 +65,29 @@ class WiFiHandler:
         Note:
             Executes: ifconfig {iface} scan
         """
-        # First, bring the interface up if it's down
-        execute_command(['ifconfig', iface, 'up'])
+        # Bring the interface up in the background; the kernel serializes
+        # the ioctls, so the scan can be issued without waiting on it
+        try:
+            up_proc = subprocess.Popen(
+                ['ifconfig', iface, 'up'],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+        except OSError as e:
+            self.logger.warning(f"Failed to bring up {iface}: {str(e)}")
+            up_proc = None
         
         # Perform the scan
         success, stdout, stderr = execute_command(['ifconfig', iface, 'scan'], timeout=60)
         
+        # Reap the background process so it does not linger as a zombie
+        if up_proc is not None:
+            try:
+                up_proc.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                up_proc.kill()
+                up_proc.wait()
+        
         if not success:
             self.logger.error(f"Failed to scan networks on {iface}: {stderr}")
             return []
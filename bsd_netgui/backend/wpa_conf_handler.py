@@ -411,10 +411,14 @@ class WPAConfHandler:
         Returns:
             True if removed, False if not found
         """
-        original_count = len(self.networks)
-        self.networks = [n for n in self.networks if n.ssid != ssid]
-        
-        if len(self.networks) < original_count:
+        # Delete matches in place, walking backwards so indices stay valid
+        removed = False
+        for i in range(len(self.networks) - 1, -1, -1):
+            if self.networks[i].ssid == ssid:
+                del self.networks[i]
+                removed = True
+        
+        if removed:
             self.logger.info(f"Removed network: {ssid}")
             return True
         
@@ -2,6 +2,7 @@
 
 import wx
 import logging
+import threading
 from ..backend.backup_handler import BackupHandler
 
 
@@ -27,6 +28,14 @@ class BackupPanel(wx.Panel):
         # Initialize backup handler
         self.backup_handler = BackupHandler()
         
+        # Backups shown in the list, indexed by list item data
+        self._backups = []
+        self._details = []
+        
+        # Cleared on destroy so late background results are dropped
+        self._alive = True
+        self.Bind(wx.EVT_WINDOW_DESTROY, self.on_destroy)
+        
         self._create_ui()
         self.refresh()
     
@@ -125,32 +134,113 @@ class BackupPanel(wx.Panel):
     def refresh(self):
         """Refresh the backup list."""
         self.logger.info("Refreshing backup list")
-        self.backup_list.DeleteAllItems()
+        self.refresh_btn.Enable(False)
         
+        # Enumerate backups in background thread
+        thread = threading.Thread(target=self._refresh_in_background)
+        thread.daemon = True
+        thread.start()
+    
+    def _refresh_in_background(self):
+        """List backups in background thread."""
         try:
-            backups = self.backup_handler.list_backups()
-            
-            for backup in backups:
-                index = self.backup_list.GetItemCount()
-                self.backup_list.InsertItem(index, backup.timestamp)
-                self.backup_list.SetItem(index, 1, backup.method)
-                self.backup_list.SetItem(index, 2, backup.reason or "No reason specified")
-                self.backup_list.SetItem(index, 3, backup.hostname or "Unknown")
-                
-                # Store backup ID in item data
-                if backup.method == 'zfs' and backup.snapshot_name:
-                    self.backup_list.SetItemData(index, hash(backup.snapshot_name))
-                else:
-                    # Extract timestamp from ISO format
-                    timestamp = backup.timestamp.replace(':', '').replace('-', '')[:15]
-                    self.backup_list.SetItemData(index, hash(timestamp))
+            backups = list(self.backup_handler.list_backups())
+            wx.CallAfter(self._populate_list, backups)
         except Exception as e:
             self.logger.error(f"Error refreshing backups: {e}")
-            wx.MessageBox(
-                f"Error loading backups:\n{str(e)}",
-                "Error",
-                wx.OK | wx.ICON_ERROR
-            )
+            wx.CallAfter(self._handle_refresh_error, e)
+    
+    def _populate_list(self, backups):
+        """
+        Populate the backup list in the main thread.
+        
+        Args:
+            backups: List of BackupMetadata objects
+        """
+        if not self._alive:
+            return
+        
+        self._backups = backups
+        self._details = [self._format_details(backup) for backup in backups]
+        
+        # Repaint once after all rows are in place
+        self.backup_list.Freeze()
+        try:
+            self.backup_list.DeleteAllItems()
+            for i, backup in enumerate(self._backups):
+                # Append sets every column in one call
+                index = self.backup_list.Append((
+                    backup.timestamp,
+                    backup.method,
+                    backup.reason or "No reason specified",
+                    backup.hostname or "Unknown",
+                ))
+                
+                # Store position in the cached backup list as item data
+                self.backup_list.SetItemData(index, i)
+        finally:
+            self.backup_list.Thaw()
+        
+        self.refresh_btn.Enable(True)
+    
+    def _handle_refresh_error(self, error):
+        """Handle backup listing error."""
+        if not self._alive:
+            return
+        
+        self.refresh_btn.Enable(True)
+        wx.MessageBox(
+            f"Error loading backups:\n{str(error)}",
+            "Error",
+            wx.OK | wx.ICON_ERROR
+        )
+    
+    def on_destroy(self, event):
+        """Handle panel destruction."""
+        if event.GetEventObject() is self:
+            self._alive = False
+        event.Skip()
+    
+    def _get_backup(self, index):
+        """
+        Get the cached backup for a list row.
+        
+        Args:
+            index: List item index
+        
+        Returns:
+            BackupMetadata or None
+        """
+        i = self.backup_list.GetItemData(index)
+        if 0 <= i < len(self._backups):
+            return self._backups[i]
+        return None
+    
+    def _format_details(self, backup):
+        """
+        Build the details text for a backup.
+        
+        Args:
+            backup: BackupMetadata object
+        
+        Returns:
+            Details string
+        """
+        lines = [
+            f"Timestamp: {backup.timestamp}",
+            f"Method: {backup.method}",
+            f"Reason: {backup.reason or 'No reason specified'}",
+            f"Hostname: {backup.hostname or 'Unknown'}",
+        ]
+        
+        if backup.user:
+            lines.append(f"User: {backup.user}")
+        if backup.files:
+            lines.append(f"Files: {', '.join(backup.files)}")
+        if backup.snapshot_name:
+            lines.append(f"Snapshot: {backup.snapshot_name}")
+        
+        return "\n".join(lines) + "\n"
     
     def on_backup_selected(self, event):
         """Handle backup selection."""
@@ -158,35 +248,10 @@ class BackupPanel(wx.Panel):
         if index == -1:
             return
         
-        # Get backup details
-        timestamp = self.backup_list.GetItemText(index, 0)
-        method = self.backup_list.GetItemText(index, 1)
-        reason = self.backup_list.GetItemText(index, 2)
-        hostname = self.backup_list.GetItemText(index, 3)
-        
-        # Find the actual backup
-        backups = self.backup_handler.list_backups()
-        selected_backup = None
-        for backup in backups:
-            if backup.timestamp == timestamp:
-                selected_backup = backup
-                break
-        
-        # Display details
-        details = f"Timestamp: {timestamp}\n"
-        details += f"Method: {method}\n"
-        details += f"Reason: {reason}\n"
-        details += f"Hostname: {hostname}\n"
-        
-        if selected_backup:
-            if selected_backup.user:
-                details += f"User: {selected_backup.user}\n"
-            if selected_backup.files:
-                details += f"Files: {', '.join(selected_backup.files)}\n"
-            if selected_backup.snapshot_name:
-                details += f"Snapshot: {selected_backup.snapshot_name}\n"
-        
-        self.details_text.SetValue(details)
+        # Display pre-rendered details
+        i = self.backup_list.GetItemData(index)
+        if 0 <= i < len(self._details):
+            self.details_text.SetValue(self._details[i])
         
         # Enable buttons
         self.restore_btn.Enable(True)
@@ -245,15 +310,9 @@ class BackupPanel(wx.Panel):
         timestamp = self.backup_list.GetItemText(index, 0)
         method = self.backup_list.GetItemText(index, 1)
         
-        # Find the backup
-        backups = self.backup_handler.list_backups()
-        selected_backup = None
-        for backup in backups:
-            if backup.timestamp == timestamp:
-                selected_backup = backup
-                break
+        selected_backup = self._get_backup(index)
         
-        if not selected_backup:
+        if not selected_backup or not selected_backup.backup_id:
             wx.MessageBox(
                 "Could not find backup details.",
                 "Error",
@@ -278,15 +337,8 @@ class BackupPanel(wx.Panel):
                 # Create backup of current state first
                 self.backup_handler.create_backup("Before restore")
                 
-                # Determine backup ID
-                if method == 'zfs' and selected_backup.snapshot_name:
-                    backup_id = selected_backup.snapshot_name
-                else:
-                    # Extract timestamp
-                    backup_id = selected_backup.timestamp.replace(':', '').replace('-', '')[:15]
-                
                 # Restore
-                if self.backup_handler.restore_backup(backup_id):
+                if self.backup_handler.restore_backup(selected_backup.backup_id):
                     wx.MessageBox(
                         f"Configuration restored successfully!\n\n"
                         f"You may need to restart network services or reboot\n"
@@ -318,15 +370,9 @@ class BackupPanel(wx.Panel):
         timestamp = self.backup_list.GetItemText(index, 0)
         method = self.backup_list.GetItemText(index, 1)
         
-        # Find the backup
-        backups = self.backup_handler.list_backups()
-        selected_backup = None
-        for backup in backups:
-            if backup.timestamp == timestamp:
-                selected_backup = backup
-                break
+        selected_backup = self._get_backup(index)
         
-        if not selected_backup:
+        if not selected_backup or not selected_backup.backup_id:
             wx.MessageBox(
                 "Could not find backup details.",
                 "Error",
@@ -346,14 +392,8 @@ class BackupPanel(wx.Panel):
         
         if result == wx.YES:
             try:
-                # Determine backup ID
-                if method == 'zfs' and selected_backup.snapshot_name:
-                    backup_id = selected_backup.snapshot_name
-                else:
-                    backup_id = selected_backup.timestamp.replace(':', '').replace('-', '')[:15]
-                
                 # Delete
-                if self.backup_handler.delete_backup(backup_id):
+                if self.backup_handler.delete_backup(selected_backup.backup_id):
                     wx.MessageBox(
                         "Backup deleted successfully!",
                         "Success",
@@ -1,11 +1,37 @@
 """Network diagnostics panel for BSD Network Manager."""
 
 import wx
+import time
 import logging
-import threading
+import functools
+import concurrent.futures
 from ..backend.diagnostics_handler import DiagnosticsHandler
 
 
+@functools.lru_cache(maxsize=1)
+def _build_help_content():
+    """
+    Build the common issues help text.
+    
+    The help content is static, so it is rendered once per process and
+    shared by every panel instance.
+    
+    Returns:
+        Formatted help text
+    """
+    separator = "=" * 70
+    parts = ["Common Network Issues and Solutions\n", separator, "\n\n"]
+    
+    for issue_info in DiagnosticsHandler().get_common_issues_help():
+        parts.append(f"Issue: {issue_info['issue']}\n")
+        parts.append(f"{'-' * 70}\n")
+        parts.append(f"Solution:\n{issue_info['help']}\n\n")
+        parts.append(f"Reference: {issue_info['handbook']}\n")
+        parts.append(f"\n{separator}\n\n")
+    
+    return "".join(parts)
+
+
 class DiagnosticsPanel(wx.Panel):
     """
     Panel for displaying network diagnostics and running connectivity tests.
@@ -13,6 +39,39 @@ class DiagnosticsPanel(wx.Panel):
     Provides real-time network status information and troubleshooting tools.
     """
     
+    # Seconds a collected diagnostics section is reused before re-running
+    DIAG_CACHE_TTL = 2.0
+    
+    # Tabs showing collected sections, in _set_section_texts order
+    SECTION_LABELS = ("Interface Status", "Routing Table", "DNS Config",
+                      "ARP Table", "Connections")
+    
+    # Sections that may be very large (routing, ARP, connections) and are
+    # filled in chunks, yielding to the event loop in between
+    CHUNKED_SECTIONS = (1, 3, 4)
+    TEXT_CHUNK_SIZE = 64 * 1024
+    
+    # Text control styles for those tabs
+    SECTION_STYLES = (
+        wx.TE_MULTILINE | wx.TE_READONLY | wx.TE_DONTWRAP | wx.HSCROLL,
+        wx.TE_MULTILINE | wx.TE_READONLY | wx.TE_DONTWRAP | wx.HSCROLL,
+        wx.TE_MULTILINE | wx.TE_READONLY,
+        wx.TE_MULTILINE | wx.TE_READONLY | wx.TE_DONTWRAP | wx.HSCROLL,
+        wx.TE_MULTILINE | wx.TE_READONLY | wx.TE_DONTWRAP | wx.HSCROLL,
+    )
+    
+    # Milliseconds a success notice stays in the status bar
+    NOTICE_TIMEOUT_MS = 3000
+    
+    # Milliseconds between pulses of the export progress bar
+    PULSE_INTERVAL_MS = 100
+    
+    # Indicator colours, created by _init_colors once wx is initialised
+    _COLOR_SUCCESS = None
+    _COLOR_FAILURE = None
+    _COLOR_ERROR = None
+    _COLOR_UNKNOWN = None
+    
     def __init__(self, parent, network_manager):
         """
         Initialize the diagnostics panel.
@@ -28,8 +87,64 @@ class DiagnosticsPanel(wx.Panel):
         # Initialize diagnostics handler
         self.diag_handler = DiagnosticsHandler()
         
+        self._init_colors()
+        
+        # Collector results: {name: (timestamp, value)}
+        self._diag_cache = {}
+        
+        # Set while a background refresh is in flight
+        self._refreshing = False
+        
+        # Latest text of each section and its control once the tab is built
+        self._section_values = [""] * len(self.SECTION_LABELS)
+        self._section_ctrls = [None] * len(self.SECTION_LABELS)
+        self._tab_built = [False] * (len(self.SECTION_LABELS) + 1)
+        
+        # Bumped to cancel a section's in-flight chunked fill
+        self._chunk_gen = [0] * len(self.SECTION_LABELS)
+        
+        # Results of the most recent refresh and connectivity test run
+        self._last_diagnostics = None
+        self._last_tests = None
+        
+        # Last (color, message) applied to each status indicator
+        self._indicator_state = {}
+        
+        # Shared worker threads for refreshes, tests, copy and export
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="diag"
+        )
+        
+        # Worker threads running the individual collectors and connectivity
+        # probes of a refresh or test run side by side
+        self._probe_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=5, thread_name_prefix="diag-probe"
+        )
+        
+        # Cleared on destroy so late background results are dropped
+        self._alive = True
+        self.Bind(wx.EVT_WINDOW_DESTROY, self.on_destroy)
+        
+        # Keeps the export progress bar moving while the report is written
+        self._export_progress = None
+        self._pulse_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self._on_pulse_timer, self._pulse_timer)
+        
         self._create_ui()
-        self.refresh()
+        
+        # Load data once the event loop is running, after layout completes
+        self._call_after(self.refresh)
+    
+    @classmethod
+    def _init_colors(cls):
+        """Create the shared indicator colours on first use."""
+        if cls._COLOR_SUCCESS is not None:
+            return
+        
+        cls._COLOR_SUCCESS = wx.Colour(0, 200, 0)  # Green
+        cls._COLOR_FAILURE = wx.Colour(200, 0, 0)  # Red
+        cls._COLOR_ERROR = wx.Colour(255, 165, 0)  # Orange
+        cls._COLOR_UNKNOWN = wx.Colour(200, 200, 200)  # Gray
     
     def _create_ui(self):
         """Create the user interface."""
@@ -67,48 +182,17 @@ class DiagnosticsPanel(wx.Panel):
         
         main_sizer.Add(status_sizer, 0, wx.EXPAND | wx.ALL, 5)
         
-        # Notebook for different diagnostic sections
+        # Notebook for different diagnostic sections; page contents are
+        # created the first time each tab is shown
         self.notebook = wx.Notebook(self)
+        for label in self.SECTION_LABELS + ("Common Issues",):
+            page = wx.Panel(self.notebook)
+            page.SetSizer(wx.BoxSizer(wx.VERTICAL))
+            self.notebook.AddPage(page, label)
+        self.notebook.Bind(wx.EVT_NOTEBOOK_PAGE_CHANGED, self.on_page_changed)
         
-        # Interface Status tab
-        self.interface_text = wx.TextCtrl(
-            self.notebook,
-            style=wx.TE_MULTILINE | wx.TE_READONLY | wx.TE_DONTWRAP | wx.HSCROLL,
-            size=(-1, 300)
-        )
-        self.notebook.AddPage(self.interface_text, "Interface Status")
-        
-        # Routing Table tab
-        self.routing_text = wx.TextCtrl(
-            self.notebook,
-            style=wx.TE_MULTILINE | wx.TE_READONLY | wx.TE_DONTWRAP | wx.HSCROLL
-        )
-        self.notebook.AddPage(self.routing_text, "Routing Table")
-        
-        # DNS Configuration tab
-        self.dns_text = wx.TextCtrl(
-            self.notebook,
-            style=wx.TE_MULTILINE | wx.TE_READONLY
-        )
-        self.notebook.AddPage(self.dns_text, "DNS Config")
-        
-        # ARP Table tab
-        self.arp_text = wx.TextCtrl(
-            self.notebook,
-            style=wx.TE_MULTILINE | wx.TE_READONLY | wx.TE_DONTWRAP | wx.HSCROLL
-        )
-        self.notebook.AddPage(self.arp_text, "ARP Table")
-        
-        # Active Connections tab
-        self.connections_text = wx.TextCtrl(
-            self.notebook,
-            style=wx.TE_MULTILINE | wx.TE_READONLY | wx.TE_DONTWRAP | wx.HSCROLL
-        )
-        self.notebook.AddPage(self.connections_text, "Connections")
-        
-        # Help tab
-        help_panel = self._create_help_panel()
-        self.notebook.AddPage(help_panel, "Common Issues")
+        # The first tab is visible immediately
+        self._build_tab(0)
         
         main_sizer.Add(self.notebook, 1, wx.EXPAND | wx.ALL, 5)
         
@@ -152,7 +236,7 @@ class DiagnosticsPanel(wx.Panel):
         
         # Indicator (colored circle)
         indicator = wx.Panel(panel, size=(40, 40))
-        indicator.SetBackgroundColour(wx.Colour(200, 200, 200))  # Gray by default
+        indicator.SetBackgroundColour(self._COLOR_UNKNOWN)  # Gray by default
         sizer.Add(indicator, 0, wx.ALIGN_CENTER | wx.ALL, 5)
         
         # Label
@@ -172,84 +256,239 @@ class DiagnosticsPanel(wx.Panel):
             'label': status_label
         }
     
-    def _create_help_panel(self):
-        """Create the help panel with common issues."""
-        panel = wx.Panel(self.notebook)
-        sizer = wx.BoxSizer(wx.VERTICAL)
+    def _build_tab(self, index):
+        """
+        Create the contents of a notebook tab if not done yet.
         
-        help_text = wx.TextCtrl(
-            panel,
-            style=wx.TE_MULTILINE | wx.TE_READONLY | wx.TE_WORDWRAP,
-            value="Common Network Issues and Solutions\n\n"
-        )
+        Args:
+            index: Notebook page index
+        """
+        if self._tab_built[index]:
+            return
         
-        # Add common issues
-        issues = self.diag_handler.get_common_issues_help()
-        help_content = "Common Network Issues and Solutions\n"
-        help_content += "=" * 70 + "\n\n"
+        page = self.notebook.GetPage(index)
         
-        for issue_info in issues:
-            help_content += f"Issue: {issue_info['issue']}\n"
-            help_content += f"{'-' * 70}\n"
-            help_content += f"Solution:\n{issue_info['help']}\n\n"
-            help_content += f"Reference: {issue_info['handbook']}\n"
-            help_content += "\n" + "=" * 70 + "\n\n"
+        if index < len(self.SECTION_LABELS):
+            ctrl = wx.TextCtrl(
+                page,
+                style=self.SECTION_STYLES[index],
+                size=(-1, 300) if index == 0 else wx.DefaultSize
+            )
+            page.GetSizer().Add(ctrl, 1, wx.EXPAND)
+            self._section_ctrls[index] = ctrl
+            self._set_section_text(index, self._section_values[index])
+        else:
+            help_text = wx.TextCtrl(
+                page,
+                style=wx.TE_MULTILINE | wx.TE_READONLY | wx.TE_WORDWRAP,
+                value=_build_help_content()
+            )
+            page.GetSizer().Add(help_text, 1, wx.EXPAND | wx.ALL, 5)
         
-        help_text.SetValue(help_content)
-        sizer.Add(help_text, 1, wx.EXPAND | wx.ALL, 5)
+        page.Layout()
+        self._tab_built[index] = True
+    
+    def on_page_changed(self, event):
+        """Handle notebook page change."""
+        if event.GetEventObject() is self.notebook:
+            self._build_tab(event.GetSelection())
+        event.Skip()
+    
+    def on_destroy(self, event):
+        """Stop accepting background work once the panel is destroyed."""
+        if event.GetEventObject() is self:
+            self._alive = False
+            self._pulse_timer.Stop()
+            self._pool.shutdown(wait=False)
+            self._probe_pool.shutdown(wait=False)
+        event.Skip()
+    
+    def _call_after(self, fn, *args, **kwargs):
+        """
+        Call a function in the main thread unless the panel is gone by then.
         
-        panel.SetSizer(sizer)
-        return panel
+        Args:
+            fn: Function to call
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+        """
+        def call():
+            if self._alive:
+                fn(*args, **kwargs)
+        
+        wx.CallAfter(call)
     
-    def refresh(self):
-        """Refresh all diagnostic information."""
+    def refresh(self, force=False):
+        """
+        Refresh all diagnostic information.
+        
+        Args:
+            force: Bypass cached collector results
+        """
+        if self._refreshing:
+            return
+        
         self.logger.info("Refreshing diagnostics")
+        self._refreshing = True
+        self.refresh_btn.Enable(False)
         
         # Show loading message
-        self.interface_text.SetValue("Loading...")
-        self.routing_text.SetValue("Loading...")
-        self.dns_text.SetValue("Loading...")
-        self.arp_text.SetValue("Loading...")
-        self.connections_text.SetValue("Loading...")
+        self._set_section_texts(["Loading..."] * 5)
         
         # Run in background thread
-        thread = threading.Thread(target=self._refresh_in_background)
-        thread.daemon = True
-        thread.start()
+        self._pool.submit(self._refresh_in_background, force)
     
-    def _refresh_in_background(self):
-        """Refresh diagnostics in background thread."""
+    def _refresh_in_background(self, force=False):
+        """
+        Refresh diagnostics in background thread.
+        
+        Args:
+            force: Bypass cached collector results
+        """
         try:
-            # Collect diagnostic information
-            interface_status = self.diag_handler.get_interface_status()
-            routing_table = self.diag_handler.get_routing_table()
-            dns_config = self.diag_handler.get_dns_config()
-            arp_table = self.diag_handler.get_arp_table()
-            connections = self.diag_handler.get_active_connections()
+            # Collect diagnostic information; the commands are independent
+            collectors = {
+                'interface_status': self.diag_handler.get_interface_status,
+                'routing_table': self.diag_handler.get_routing_table,
+                'dns_config': self.diag_handler.get_dns_config,
+                'arp_table': self.diag_handler.get_arp_table,
+                'connections': self.diag_handler.get_active_connections,
+            }
+            results = {}
+            futures = {
+                name: self._probe_pool.submit(self._cached, name, collector, force)
+                for name, collector in collectors.items()
+            }
+            for name, future in futures.items():
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    self.logger.error(f"Error collecting {name}: {e}")
+                    results[name] = f"Error: {str(e)}"
+            
+            self._last_diagnostics = {
+                'interface_status': results['interface_status'],
+                'routing_table': results['routing_table'],
+                'dns_config': results['dns_config'],
+                'arp_table': results['arp_table'],
+                'active_connections': results['connections'],
+            }
             
             # Update UI in main thread
-            wx.CallAfter(self._update_diagnostics_ui, 
-                        interface_status, routing_table, dns_config, 
-                        arp_table, connections)
+            self._call_after(self._update_diagnostics_ui,
+                             results['interface_status'], results['routing_table'],
+                             results['dns_config'], results['arp_table'],
+                             results['connections'])
         except Exception as e:
             self.logger.error(f"Error refreshing diagnostics: {e}")
-            wx.CallAfter(wx.MessageBox,
-                        f"Error refreshing diagnostics:\n{str(e)}",
-                        "Error",
-                        wx.OK | wx.ICON_ERROR)
+            self._call_after(self._refresh_done)
+            self._call_after(wx.MessageBox,
+                             f"Error refreshing diagnostics:\n{str(e)}",
+                             "Error",
+                             wx.OK | wx.ICON_ERROR)
+    
+    def _refresh_done(self):
+        """Allow the next refresh once the current one has finished."""
+        self._refreshing = False
+        self.refresh_btn.Enable(True)
+    
+    def _cached(self, name, collector, force=False):
+        """
+        Run a diagnostics collector, reusing a recent result.
+        
+        Args:
+            name: Cache key for the collector
+            collector: Callable returning the section text
+            force: Ignore any cached value
+        
+        Returns:
+            Collector output
+        """
+        entry = self._diag_cache.get(name)
+        if not force and entry and time.monotonic() - entry[0] < self.DIAG_CACHE_TTL:
+            return entry[1]
+        
+        value = collector()
+        self._diag_cache[name] = (time.monotonic(), value)
+        return value
     
     def _update_diagnostics_ui(self, interface_status, routing_table, 
                                dns_config, arp_table, connections):
         """Update diagnostics UI with collected data."""
-        self.interface_text.SetValue(interface_status)
-        self.routing_text.SetValue(routing_table)
-        self.dns_text.SetValue(dns_config)
-        self.arp_text.SetValue(arp_table)
-        self.connections_text.SetValue(connections)
+        self._set_section_texts([interface_status, routing_table, dns_config,
+                                 arp_table, connections])
+        self._refresh_done()
+    
+    def _set_section_texts(self, values):
+        """
+        Set the text of all diagnostics sections with a single repaint.
+        
+        Args:
+            values: Texts for the interface, routing, DNS, ARP and
+                connections sections, in that order
+        """
+        self._section_values = list(values)
+        
+        # Tabs not built yet pick up their text when first shown
+        self.notebook.Freeze()
+        try:
+            for index, value in enumerate(values):
+                if self._section_ctrls[index] is not None:
+                    self._set_section_text(index, value)
+        finally:
+            self.notebook.Thaw()
+    
+    def _set_section_text(self, index, value):
+        """
+        Set the text of one built diagnostics section.
+        
+        Args:
+            index: Section index
+            value: Section text
+        """
+        ctrl = self._section_ctrls[index]
+        
+        # Supersede any chunked fill still in progress
+        self._chunk_gen[index] += 1
+        
+        if index in self.CHUNKED_SECTIONS and len(value) > self.TEXT_CHUNK_SIZE:
+            ctrl.Freeze()
+            ctrl.Clear()
+            wx.CallLater(0, self._append_next_chunk, index, ctrl, value, 0,
+                         self._chunk_gen[index])
+        else:
+            ctrl.SetValue(value)
+    
+    def _append_next_chunk(self, index, ctrl, value, pos, generation):
+        """
+        Append one chunk of a section's text and schedule the next.
+        
+        Args:
+            index: Section index
+            ctrl: Text control being filled
+            value: Full section text
+            pos: Offset of the chunk to append
+            generation: Fill generation this call belongs to
+        """
+        if not ctrl:
+            return
+        
+        if generation != self._chunk_gen[index]:
+            ctrl.Thaw()
+            return
+        
+        end = pos + self.TEXT_CHUNK_SIZE
+        ctrl.AppendText(value[pos:end])
+        
+        if end < len(value):
+            wx.CallLater(0, self._append_next_chunk, index, ctrl, value, end,
+                         generation)
+        else:
+            ctrl.Thaw()
     
     def on_refresh(self, event):
         """Handle refresh button click."""
-        self.refresh()
+        self.refresh(force=True)
     
     def on_run_tests(self, event):
         """Handle run connectivity tests button click."""
@@ -260,30 +499,55 @@ class DiagnosticsPanel(wx.Panel):
         self.test_btn.SetLabel("Testing...")
         
         # Run in background thread
-        thread = threading.Thread(target=self._run_tests_in_background)
-        thread.daemon = True
-        thread.start()
+        self._pool.submit(self._run_tests_in_background)
     
     def _run_tests_in_background(self):
         """Run connectivity tests in background thread."""
         try:
-            # Run connectivity tests
-            gateway_test = self.diag_handler.test_gateway_connectivity()
-            external_test = self.diag_handler.test_external_connectivity()
-            dns_test = self.diag_handler.test_dns_resolution()
+            # Run connectivity tests concurrently; each is a blocking probe
+            futures = [
+                self._probe_pool.submit(self.diag_handler.test_gateway_connectivity),
+                self._probe_pool.submit(self.diag_handler.test_external_connectivity),
+                self._probe_pool.submit(self.diag_handler.test_dns_resolution),
+            ]
+            gateway_test, external_test, dns_test = [
+                self._test_result(future) for future in futures
+            ]
+            
+            self._last_tests = {
+                'gateway': gateway_test,
+                'external': external_test,
+                'dns': dns_test
+            }
             
             # Update UI in main thread
-            wx.CallAfter(self._update_connectivity_status, 
-                        gateway_test, external_test, dns_test)
+            self._call_after(self._update_connectivity_status,
+                             gateway_test, external_test, dns_test)
         except Exception as e:
             self.logger.error(f"Error running connectivity tests: {e}")
-            wx.CallAfter(wx.MessageBox,
-                        f"Error running tests:\n{str(e)}",
-                        "Error",
-                        wx.OK | wx.ICON_ERROR)
+            self._call_after(wx.MessageBox,
+                             f"Error running tests:\n{str(e)}",
+                             "Error",
+                             wx.OK | wx.ICON_ERROR)
         finally:
-            wx.CallAfter(self.test_btn.Enable, True)
-            wx.CallAfter(self.test_btn.SetLabel, "Run Connectivity Tests")
+            self._call_after(self.test_btn.Enable, True)
+            self._call_after(self.test_btn.SetLabel, "Run Connectivity Tests")
+    
+    def _test_result(self, future):
+        """
+        Get a connectivity test result, converting exceptions to errors.
+        
+        Args:
+            future: Future of a connectivity test
+        
+        Returns:
+            Test result dictionary
+        """
+        try:
+            return future.result()
+        except Exception as e:
+            self.logger.error(f"Connectivity test failed: {e}")
+            return {'status': 'error', 'message': f"Error: {str(e)}"}
     
     def _update_connectivity_status(self, gateway_test, external_test, dns_test):
         """Update connectivity status indicators."""
@@ -322,13 +586,19 @@ class DiagnosticsPanel(wx.Panel):
             message: Status message
         """
         if status == 'success':
-            color = wx.Colour(0, 200, 0)  # Green
+            color = self._COLOR_SUCCESS
         elif status == 'failure':
-            color = wx.Colour(200, 0, 0)  # Red
+            color = self._COLOR_FAILURE
         elif status == 'error':
-            color = wx.Colour(255, 165, 0)  # Orange
+            color = self._COLOR_ERROR
         else:
-            color = wx.Colour(200, 200, 200)  # Gray
+            color = self._COLOR_UNKNOWN
+        
+        # Nothing to repaint if the indicator already shows this status
+        state = (color.Get(), message)
+        if self._indicator_state.get(id(indicator)) == state:
+            return
+        self._indicator_state[id(indicator)] = state
         
         indicator.SetBackgroundColour(color)
         indicator.Refresh()
@@ -336,27 +606,46 @@ class DiagnosticsPanel(wx.Panel):
     
     def on_copy_to_clipboard(self, event):
         """Handle copy to clipboard button click."""
+        # Get current tab content
+        selection = self.notebook.GetSelection()
+        
+        if 0 <= selection < len(self.SECTION_LABELS):
+            self._copy_text(self._section_values[selection])
+        elif self._last_diagnostics is not None:
+            # Reuse the data collected by the last refresh
+            diagnostics = dict(self._last_diagnostics)
+            if self._last_tests is not None:
+                diagnostics['connectivity_tests'] = self._last_tests
+            self._copy_text(self._format_diagnostics_text(diagnostics))
+        else:
+            # Nothing collected yet; gather full diagnostics in background
+            self.copy_btn.Enable(False)
+            self._pool.submit(self._copy_in_background)
+    
+    def _copy_in_background(self):
+        """Collect full diagnostics in background thread and copy them."""
         try:
-            # Get current tab content
-            current_page = self.notebook.GetCurrentPage()
-            
-            if isinstance(current_page, wx.TextCtrl):
-                text = current_page.GetValue()
-            else:
-                # Export full diagnostics
-                diagnostics = self.diag_handler.run_full_diagnostics()
-                text = self._format_diagnostics_text(diagnostics)
-            
-            # Copy to clipboard
-            if wx.TheClipboard.Open():
-                wx.TheClipboard.SetData(wx.TextDataObject(text))
-                wx.TheClipboard.Close()
-                
-                wx.MessageBox(
-                    "Diagnostics copied to clipboard!",
-                    "Success",
-                    wx.OK | wx.ICON_INFORMATION
-                )
+            diagnostics = self.diag_handler.run_full_diagnostics()
+            self._call_after(self._copy_text, self._format_diagnostics_text(diagnostics))
+        except Exception as e:
+            self.logger.error(f"Error collecting diagnostics: {e}")
+            self._call_after(wx.MessageBox,
+                             f"Error copying to clipboard:\n{str(e)}",
+                             "Error",
+                             wx.OK | wx.ICON_ERROR)
+        finally:
+            self._call_after(self.copy_btn.Enable, True)
+    
+    def _copy_text(self, text):
+        """
+        Copy text to the clipboard.
+        
+        Args:
+            text: Text to copy
+        """
+        try:
+            self._set_clipboard_text(text)
+            self._notify("Diagnostics copied to clipboard")
         except Exception as e:
             self.logger.error(f"Error copying to clipboard: {e}")
             wx.MessageBox(
@@ -365,6 +654,47 @@ class DiagnosticsPanel(wx.Panel):
                 wx.OK | wx.ICON_ERROR
             )
     
+    def _set_clipboard_text(self, text):
+        """
+        Place text on the clipboard, always closing it again.
+        
+        Args:
+            text: Text to copy
+        
+        Raises:
+            RuntimeError: If the clipboard cannot be opened
+        """
+        clipboard = wx.TheClipboard
+        if not clipboard.Open():
+            raise RuntimeError("Unable to open the clipboard")
+        
+        try:
+            clipboard.SetData(wx.TextDataObject(text))
+        finally:
+            clipboard.Close()
+    
+    def _notify(self, message):
+        """
+        Show a transient success notice in the main window's status bar.
+        
+        Args:
+            message: Notice text
+        """
+        frame = self.GetTopLevelParent()
+        statusbar = frame.GetStatusBar() if frame else None
+        
+        if not statusbar:
+            wx.MessageBox(message, "Success", wx.OK | wx.ICON_INFORMATION)
+            return
+        
+        statusbar.SetStatusText(message)
+        wx.CallLater(self.NOTICE_TIMEOUT_MS, self._clear_notice, statusbar, message)
+    
+    def _clear_notice(self, statusbar, message):
+        """Reset the status bar unless something else replaced the notice."""
+        if statusbar and statusbar.GetStatusText() == message:
+            statusbar.SetStatusText("Ready")
+    
     def on_export_report(self, event):
         """Handle export report button click."""
         wildcard = "Text files (*.txt)|*.txt|All files (*.*)|*.*"
@@ -378,43 +708,94 @@ class DiagnosticsPanel(wx.Panel):
         
         if dialog.ShowModal() == wx.ID_OK:
             path = dialog.GetPath()
+            dialog.Destroy()
+            
+            self.export_btn.Enable(False)
             
-            try:
-                if self.diag_handler.export_diagnostics_report(path):
-                    wx.MessageBox(
-                        f"Diagnostics report exported to:\n{path}",
-                        "Success",
-                        wx.OK | wx.ICON_INFORMATION
-                    )
-                else:
-                    wx.MessageBox(
-                        "Failed to export diagnostics report.",
-                        "Error",
-                        wx.OK | wx.ICON_ERROR
-                    )
-            except Exception as e:
-                self.logger.error(f"Error exporting report: {e}")
-                wx.MessageBox(
-                    f"Error exporting report:\n{str(e)}",
-                    "Error",
-                    wx.OK | wx.ICON_ERROR
-                )
-        
-        dialog.Destroy()
+            # Show progress dialog
+            progress = wx.ProgressDialog(
+                "Exporting",
+                "Collecting diagnostics and writing report...",
+                maximum=100,
+                parent=self,
+                style=wx.PD_APP_MODAL | wx.PD_AUTO_HIDE
+            )
+            
+            # Export in background thread
+            self._pool.submit(self._export_in_background, path, progress)
+            
+            progress.Pulse()
+            self._export_progress = progress
+            self._pulse_timer.Start(self.PULSE_INTERVAL_MS)
+        else:
+            dialog.Destroy()
+    
+    def _on_pulse_timer(self, event):
+        """Advance the export progress bar."""
+        if self._export_progress is not None:
+            self._export_progress.Pulse()
+    
+    def _close_progress(self, progress):
+        """
+        Stop pulsing and close the export progress dialog.
+        
+        Args:
+            progress: Progress dialog to close
+        """
+        self._pulse_timer.Stop()
+        self._export_progress = None
+        progress.Destroy()
+    
+    def _export_in_background(self, path, progress):
+        """
+        Export the diagnostics report in background thread.
+        
+        Args:
+            path: Destination file path
+            progress: Progress dialog to close when done
+        """
+        try:
+            success = self.diag_handler.export_diagnostics_report(path)
+            self._call_after(self._handle_export_result, success, path, progress)
+        except Exception as e:
+            self.logger.error(f"Error exporting report: {e}")
+            self._call_after(self._handle_export_error, e, progress)
+    
+    def _handle_export_result(self, success, path, progress):
+        """Handle export result."""
+        self._close_progress(progress)
+        self.export_btn.Enable(True)
+        
+        if success:
+            self._notify(f"Diagnostics report exported to {path}")
+        else:
+            wx.MessageBox(
+                "Failed to export diagnostics report.",
+                "Error",
+                wx.OK | wx.ICON_ERROR
+            )
+    
+    def _handle_export_error(self, error, progress):
+        """Handle export error."""
+        self._close_progress(progress)
+        self.export_btn.Enable(True)
+        wx.MessageBox(
+            f"Error exporting report:\n{str(error)}",
+            "Error",
+            wx.OK | wx.ICON_ERROR
+        )
     
     def _format_diagnostics_text(self, diagnostics):
         """Format diagnostics dictionary as text."""
-        text = "Network Diagnostics Report\n"
-        text += "=" * 70 + "\n\n"
+        parts = ["Network Diagnostics Report\n", "=" * 70, "\n\n"]
         
         for key, value in diagnostics.items():
-            text += f"{key.replace('_', ' ').title()}:\n"
-            text += "-" * 70 + "\n"
+            parts.append(f"{key.replace('_', ' ').title()}:\n")
+            parts.append("-" * 70 + "\n")
             if isinstance(value, dict):
-                for k, v in value.items():
-                    text += f"{k}: {v}\n"
+                parts.extend(f"{k}: {v}\n" for k, v in value.items())
             else:
-                text += str(value) + "\n"
-            text += "\n"
+                parts.append(f"{value}\n")
+            parts.append("\n")
         
-        return text
+        return "".join(parts)
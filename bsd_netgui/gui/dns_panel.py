@@ -2,6 +2,7 @@
 
 import wx
 import logging
+import threading
 from ..utils.system_utils import validate_ip_address
 
 
@@ -24,8 +25,17 @@ class DNSPanel(wx.Panel):
         self.network_manager = network_manager
         self.logger = logging.getLogger(__name__)
         
+        # Held while a background refresh is in flight
+        self._refresh_lock = threading.Lock()
+        
+        # Mirror of the listbox contents, in order, plus a set for lookups
+        self._dns_servers = []
+        self._dns_set = set()
+        
         self._create_ui()
-        self.refresh()
+        
+        # Load data once the event loop is running, after layout completes
+        wx.CallAfter(self.refresh)
     
     def _create_ui(self):
         """Create the user interface."""
@@ -91,24 +101,69 @@ class DNSPanel(wx.Panel):
     
     def refresh(self):
         """Refresh the DNS servers list."""
+        if not self._refresh_lock.acquire(blocking=False):
+            self.logger.debug("DNS refresh already in progress")
+            return
+        
         self.logger.info("Refreshing DNS servers")
-        self.dns_listbox.Clear()
         
+        # Run in background thread
+        thread = threading.Thread(target=self._refresh_in_background)
+        thread.daemon = True
+        thread.start()
+    
+    def apply_snapshot(self, dns_servers):
+        """
+        Show a DNS server list collected elsewhere.
+        
+        Args:
+            dns_servers: List of DNS server addresses
+        """
+        # A refresh already in flight will deliver its own result
+        if not self._refresh_lock.acquire(blocking=False):
+            return
+        
+        self._apply_dns_list(dns_servers)
+    
+    def _refresh_in_background(self):
+        """Read DNS servers in background thread."""
         try:
             dns_servers = self.network_manager.get_dns_servers()
+            wx.CallAfter(self._apply_dns_list, dns_servers)
+        except Exception as e:
+            self.logger.error(f"Error refreshing DNS servers: {e}")
+            wx.CallAfter(self._handle_refresh_error, e)
+    
+    def _apply_dns_list(self, dns_servers):
+        """
+        Populate the DNS listbox in the main thread.
+        
+        Args:
+            dns_servers: List of DNS server addresses
+        """
+        try:
+            self._dns_servers = list(dns_servers)
+            self._dns_set = set(self._dns_servers)
             
-            for server in dns_servers:
-                self.dns_listbox.Append(server)
+            # Replace contents in one call, repainting once
+            self.dns_listbox.Freeze()
+            try:
+                self.dns_listbox.Set(self._dns_servers)
+            finally:
+                self.dns_listbox.Thaw()
             
             self.logger.info(f"Loaded {len(dns_servers)} DNS servers")
-            
-        except Exception as e:
-            self.logger.error(f"Error refreshing DNS servers: {e}")
-            wx.MessageBox(
-                f"Error loading DNS servers:\n{str(e)}",
-                "Error",
-                wx.OK | wx.ICON_ERROR
-            )
+        finally:
+            self._refresh_lock.release()
+    
+    def _handle_refresh_error(self, error):
+        """Handle DNS refresh error."""
+        self._refresh_lock.release()
+        wx.MessageBox(
+            f"Error loading DNS servers:\n{str(error)}",
+            "Error",
+            wx.OK | wx.ICON_ERROR
+        )
     
     def on_refresh(self, event):
         """Handle refresh button."""
@@ -136,7 +191,7 @@ class DNSPanel(wx.Panel):
             return
         
         # Check if already exists
-        if self.dns_listbox.FindString(dns_server) != wx.NOT_FOUND:
+        if dns_server in self._dns_set:
             wx.MessageBox(
                 f"DNS server {dns_server} already exists in the list.",
                 "Duplicate Entry",
@@ -146,6 +201,8 @@ class DNSPanel(wx.Panel):
         
         # Add to list
         self.dns_listbox.Append(dns_server)
+        self._dns_servers.append(dns_server)
+        self._dns_set.add(dns_server)
         self.dns_input.Clear()
         
         self.logger.info(f"Added DNS server {dns_server} to list (not yet applied)")
@@ -173,14 +230,14 @@ class DNSPanel(wx.Panel):
         
         if result == wx.YES:
             self.dns_listbox.Delete(selection)
+            del self._dns_servers[selection]
+            self._dns_set.discard(dns_server)
             self.logger.info(f"Removed DNS server {dns_server} from list (not yet applied)")
     
     def on_apply(self, event):
         """Handle apply changes button."""
-        # Get all DNS servers from the listbox
-        dns_servers = []
-        for i in range(self.dns_listbox.GetCount()):
-            dns_servers.append(self.dns_listbox.GetString(i))
+        # Copy the mirrored listbox contents, keeping their order
+        dns_servers = list(self._dns_servers)
         
         if not dns_servers:
             result = wx.MessageBox(
@@ -2,9 +2,56 @@
 
 import wx
 import logging
+import functools
+import threading
 from ..utils.system_utils import validate_ip_address, validate_netmask
 
 
+class InterfaceListCtrl(wx.ListCtrl):
+    """
+    Virtual list control showing one row per interface.
+    
+    Cell text is read on demand from a list of row tuples instead of being
+    copied into the native control item by item.
+    """
+    
+    def __init__(self, parent):
+        """
+        Initialize the interface list.
+        
+        Args:
+            parent: Parent window
+        """
+        super().__init__(
+            parent,
+            style=wx.LC_REPORT | wx.LC_VIRTUAL | wx.LC_SINGLE_SEL | wx.BORDER_SUNKEN
+        )
+        self.rows = []
+    
+    def set_rows(self, rows):
+        """
+        Replace the displayed rows.
+        
+        Args:
+            rows: List of IfaceRow tuples, whose leading fields match the
+                columns
+        """
+        self.rows = rows
+        
+        # Resize and repaint as one update
+        self.Freeze()
+        try:
+            self.SetItemCount(len(rows))
+            if rows:
+                self.RefreshItems(0, len(rows) - 1)
+        finally:
+            self.Thaw()
+    
+    def OnGetItemText(self, item, col):
+        """Return the text of a cell for the virtual list."""
+        return self.rows[item][col]
+
+
 class InterfacePanel(wx.Panel):
     """
     Panel for managing network interfaces.
@@ -12,6 +59,9 @@ class InterfacePanel(wx.Panel):
     Provides interface to view, enable/disable, and configure network interfaces.
     """
     
+    # Seconds an interface listing may be reused across refreshes
+    INTERFACE_CACHE_TTL = 2.0
+    
     def __init__(self, parent, network_manager):
         """
         Initialize the interface panel.
@@ -24,6 +74,21 @@ class InterfacePanel(wx.Panel):
         self.network_manager = network_manager
         self.logger = logging.getLogger(__name__)
         
+        # Set while a background interface listing is running; the
+        # generation is bumped whenever newer data is shown, so stale
+        # listings are dropped
+        self._refresh_in_flight = False
+        self._refresh_gen = 0
+        
+        # Set when a refresh was requested while a listing was running
+        self._refresh_pending = False
+        
+        # Configure IP dialog, created on first use and then reused
+        self._ip_dialog = None
+        
+        # Current enabled state of the per-interface action buttons
+        self._buttons_enabled = False
+        
         self._create_ui()
         self.refresh()
     
@@ -35,10 +100,7 @@ class InterfacePanel(wx.Panel):
         list_label = wx.StaticText(self, label="Network Interfaces:")
         main_sizer.Add(list_label, 0, wx.ALL, 5)
         
-        self.interface_list = wx.ListCtrl(
-            self,
-            style=wx.LC_REPORT | wx.LC_SINGLE_SEL | wx.BORDER_SUNKEN
-        )
+        self.interface_list = InterfaceListCtrl(self)
         self.interface_list.AppendColumn("Interface", width=120)
         self.interface_list.AppendColumn("Status", width=80)
         self.interface_list.AppendColumn("IP Address", width=150)
@@ -87,63 +149,122 @@ class InterfacePanel(wx.Panel):
     
     def refresh(self):
         """Refresh the interface list."""
+        if self._refresh_in_flight:
+            # The running listing may predate a change; list again after it
+            self._refresh_gen += 1
+            self._refresh_pending = True
+            return
+        
         self.logger.info("Refreshing interface list")
-        self.interface_list.DeleteAllItems()
+        self._refresh_in_flight = True
+        self.refresh_btn.Enable(False)
         
-        try:
-            interfaces = self.network_manager.list_interfaces()
-            
-            for iface in interfaces:
-                index = self.interface_list.GetItemCount()
-                self.interface_list.InsertItem(index, iface['name'])
-                self.interface_list.SetItem(index, 1, iface['status'])
-                self.interface_list.SetItem(index, 2, iface.get('ipv4', ''))
-                self.interface_list.SetItem(index, 3, iface.get('mac', ''))
-                self.interface_list.SetItem(index, 4, iface.get('mtu', ''))
-            
-            self.logger.info(f"Loaded {len(interfaces)} interfaces")
-            
-        except Exception as e:
-            self.logger.error(f"Error refreshing interfaces: {e}")
+        self._run_async(
+            self.network_manager.list_interfaces,
+            functools.partial(self._apply_refresh_result, self._refresh_gen),
+            max_age=self.INTERFACE_CACHE_TTL
+        )
+    
+    def apply_snapshot(self, interfaces):
+        """
+        Show an interface list collected elsewhere.
+        
+        Args:
+            interfaces: List of IfaceRow tuples
+        """
+        # Anything listed before this point is now out of date
+        self._refresh_gen += 1
+        self._show_interfaces(interfaces)
+    
+    def _run_async(self, fn, on_done, *args, **kwargs):
+        """
+        Call a blocking function in a background thread.
+        
+        Args:
+            fn: Function to call
+            on_done: Called in the main thread as on_done(result, error),
+                where exactly one of result and error is meaningful
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+        """
+        def worker():
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                wx.CallAfter(on_done, None, e)
+            else:
+                wx.CallAfter(on_done, result, None)
+        
+        thread = threading.Thread(target=worker)
+        thread.daemon = True
+        thread.start()
+    
+    def _apply_refresh_result(self, gen, interfaces, error):
+        """
+        Show a fetched interface list in the main thread.
+        
+        Args:
+            gen: Refresh generation the listing was started for
+            interfaces: List of IfaceRow tuples
+            error: Exception raised while listing, or None
+        """
+        self._refresh_in_flight = False
+        self.refresh_btn.Enable(True)
+        
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self.refresh()
+            return
+        
+        if gen != self._refresh_gen:
+            self.logger.debug("Discarding stale interface list")
+            return
+        
+        if error is not None:
+            self.logger.error("Error refreshing interfaces: %s", error, exc_info=error)
             wx.MessageBox(
-                f"Error loading interfaces:\n{str(e)}",
+                f"Error loading interfaces:\n{str(error)}",
                 "Error",
                 wx.OK | wx.ICON_ERROR
             )
+            return
+        
+        self._show_interfaces(interfaces)
+    
+    def _show_interfaces(self, interfaces):
+        """
+        Show an interface list.
+        
+        Args:
+            interfaces: List of IfaceRow tuples
+        """
+        self.interface_list.set_rows(interfaces)
+        
+        self.logger.info("Loaded %d interfaces", len(interfaces))
     
     def on_interface_selected(self, event):
         """Handle interface selection."""
-        index = event.GetIndex()
-        iface_name = self.interface_list.GetItemText(index, 0)
+        # The listing already carries every detail shown here
+        row = self.interface_list.rows[event.GetIndex()]
+        
+        details_text = (
+            f"Interface: {row.name}\n"
+            f"Status: {row.status}\n"
+            f"IP Address: {row.ipv4 or 'N/A'}\n"
+            f"Netmask: {row.netmask or 'N/A'}\n"
+            f"MAC Address: {row.mac or 'N/A'}\n"
+            f"MTU: {row.mtu or 'N/A'}\n"
+        )
         
-        try:
-            iface_details = self.network_manager.get_interface_details(iface_name)
-            
-            if iface_details:
-                details_text = f"Interface: {iface_details['name']}\n"
-                details_text += f"Status: {iface_details['status']}\n"
-                details_text += f"IP Address: {iface_details.get('ipv4', 'N/A')}\n"
-                details_text += f"Netmask: {iface_details.get('netmask', 'N/A')}\n"
-                details_text += f"MAC Address: {iface_details.get('mac', 'N/A')}\n"
-                details_text += f"MTU: {iface_details.get('mtu', 'N/A')}\n"
-                
-                self.details_text.SetValue(details_text)
-                
-                # Enable buttons
-                self.enable_btn.Enable(True)
-                self.disable_btn.Enable(True)
-                self.config_btn.Enable(True)
+        self.details_text.SetValue(details_text)
         
-        except Exception as e:
-            self.logger.error(f"Error getting interface details: {e}")
-            wx.MessageBox(
-                f"Error getting interface details:\n{str(e)}",
-                "Error",
-                wx.OK | wx.ICON_ERROR
-            )
+        # Enable buttons
+        self._set_action_buttons(True)
     
     def on_refresh(self, event):
         """Handle refresh button."""
+        # An explicit refresh always re-queries the system
+        self.network_manager.invalidate_interface_cache()
         self.refresh()
     
     def on_enable(self, event):
@@ -152,27 +273,12 @@ class InterfacePanel(wx.Panel):
         if not iface_name:
             return
         
-        try:
-            if self.network_manager.enable_interface(iface_name):
-                wx.MessageBox(
-                    f"Interface {iface_name} enabled successfully.",
-                    "Success",
-                    wx.OK | wx.ICON_INFORMATION
-                )
-                self.refresh()
-            else:
-                wx.MessageBox(
-                    f"Failed to enable interface {iface_name}.",
-                    "Error",
-                    wx.OK | wx.ICON_ERROR
-                )
-        except Exception as e:
-            self.logger.error(f"Error enabling interface: {e}")
-            wx.MessageBox(
-                f"Error enabling interface:\n{str(e)}",
-                "Error",
-                wx.OK | wx.ICON_ERROR
-            )
+        self._set_action_buttons(False)
+        self._run_async(
+            self.network_manager.enable_interface,
+            functools.partial(self._handle_toggle_result, iface_name, True),
+            iface_name
+        )
     
     def on_disable(self, event):
         """Handle disable button."""
@@ -180,27 +286,59 @@ class InterfacePanel(wx.Panel):
         if not iface_name:
             return
         
-        try:
-            if self.network_manager.disable_interface(iface_name):
-                wx.MessageBox(
-                    f"Interface {iface_name} disabled successfully.",
-                    "Success",
-                    wx.OK | wx.ICON_INFORMATION
-                )
-                self.refresh()
-            else:
-                wx.MessageBox(
-                    f"Failed to disable interface {iface_name}.",
-                    "Error",
-                    wx.OK | wx.ICON_ERROR
-                )
-        except Exception as e:
-            self.logger.error(f"Error disabling interface: {e}")
+        self._set_action_buttons(False)
+        self._run_async(
+            self.network_manager.disable_interface,
+            functools.partial(self._handle_toggle_result, iface_name, False),
+            iface_name
+        )
+    
+    def _handle_toggle_result(self, iface_name, enable, success, error):
+        """
+        Report the outcome of enabling or disabling an interface.
+        
+        Args:
+            iface_name: Interface name
+            enable: True if the interface was being enabled
+            success: Result of the backend call
+            error: Exception raised by the backend call, or None
+        """
+        self._set_action_buttons(True)
+        if enable:
+            action, doing, done = "enable", "enabling", "enabled"
+        else:
+            action, doing, done = "disable", "disabling", "disabled"
+        
+        if error is not None:
+            self.logger.error("Error %s interface: %s", doing, error, exc_info=error)
             wx.MessageBox(
-                f"Error disabling interface:\n{str(e)}",
+                f"Error {doing} interface:\n{str(error)}",
                 "Error",
                 wx.OK | wx.ICON_ERROR
             )
+        elif success:
+            wx.MessageBox(
+                f"Interface {iface_name} {done} successfully.",
+                "Success",
+                wx.OK | wx.ICON_INFORMATION
+            )
+            self.refresh()
+        else:
+            wx.MessageBox(
+                f"Failed to {action} interface {iface_name}.",
+                "Error",
+                wx.OK | wx.ICON_ERROR
+            )
+    
+    def _set_action_buttons(self, enabled):
+        """Enable or disable the per-interface action buttons."""
+        if enabled == self._buttons_enabled:
+            return
+        
+        self.enable_btn.Enable(enabled)
+        self.disable_btn.Enable(enabled)
+        self.config_btn.Enable(enabled)
+        self._buttons_enabled = enabled
     
     def on_configure_ip(self, event):
         """Handle configure IP button."""
@@ -208,10 +346,13 @@ class InterfacePanel(wx.Panel):
         if not iface_name:
             return
         
-        dialog = ConfigureIPDialog(self, iface_name, self.network_manager)
-        if dialog.ShowModal() == wx.ID_OK:
+        if self._ip_dialog is None:
+            self._ip_dialog = ConfigureIPDialog(self, iface_name, self.network_manager)
+        else:
+            self._ip_dialog.reset(iface_name)
+        
+        if self._ip_dialog.ShowModal() == wx.ID_OK:
             self.refresh()
-        dialog.Destroy()
     
     def _get_selected_interface(self):
         """Get the currently selected interface name."""
@@ -223,7 +364,7 @@ class InterfacePanel(wx.Panel):
                 wx.OK | wx.ICON_WARNING
             )
             return None
-        return self.interface_list.GetItemText(index, 0)
+        return self.interface_list.rows[index].name
 
 
 class ConfigureIPDialog(wx.Dialog):
@@ -248,7 +389,11 @@ class ConfigureIPDialog(wx.Dialog):
         self.network_manager = network_manager
         self.logger = logging.getLogger(__name__)
         
+        # Set while the configuration is being applied
+        self._apply_in_flight = False
+        
         self._create_ui()
+        self.Bind(wx.EVT_CLOSE, self.on_close)
         self.Centre()
     
     def _create_ui(self):
@@ -302,12 +447,12 @@ class ConfigureIPDialog(wx.Dialog):
         
         # Buttons
         button_sizer = wx.BoxSizer(wx.HORIZONTAL)
-        ok_btn = wx.Button(panel, wx.ID_OK, "Apply")
-        ok_btn.Bind(wx.EVT_BUTTON, self.on_apply)
-        button_sizer.Add(ok_btn, 0, wx.ALL, 5)
+        self.ok_btn = wx.Button(panel, wx.ID_OK, "Apply")
+        self.ok_btn.Bind(wx.EVT_BUTTON, self.on_apply)
+        button_sizer.Add(self.ok_btn, 0, wx.ALL, 5)
         
-        cancel_btn = wx.Button(panel, wx.ID_CANCEL, "Cancel")
-        button_sizer.Add(cancel_btn, 0, wx.ALL, 5)
+        self.cancel_btn = wx.Button(panel, wx.ID_CANCEL, "Cancel")
+        button_sizer.Add(self.cancel_btn, 0, wx.ALL, 5)
         
         main_sizer.Add(button_sizer, 0, wx.ALIGN_CENTER | wx.ALL, 10)
         
@@ -317,6 +462,28 @@ class ConfigureIPDialog(wx.Dialog):
         self.dhcp_radio.SetValue(True)
         self.on_config_type_changed(None)
     
+    def reset(self, iface_name):
+        """
+        Prepare the dialog to configure another interface.
+        
+        Args:
+            iface_name: Interface name to configure
+        """
+        # Keep the running apply's interface and controls
+        if self._apply_in_flight:
+            return
+        
+        self.iface_name = iface_name
+        self.SetTitle(f"Configure IP - {iface_name}")
+        
+        self.ip_text.Clear()
+        self.netmask_text.SetValue("255.255.255.0")
+        self.gateway_text.Clear()
+        self.ok_btn.Enable(True)
+        
+        self.dhcp_radio.SetValue(True)
+        self.on_config_type_changed(None)
+    
     def on_config_type_changed(self, event):
         """Handle configuration type change."""
         use_static = self.static_radio.GetValue()
@@ -324,70 +491,108 @@ class ConfigureIPDialog(wx.Dialog):
         self.netmask_text.Enable(use_static)
         self.gateway_text.Enable(use_static)
     
+    def _set_applying(self, applying):
+        """
+        Lock the dialog while the configuration is being applied.
+        
+        Args:
+            applying: True when an apply starts, False when it finishes
+        """
+        self._apply_in_flight = applying
+        self.ok_btn.Enable(not applying)
+        self.cancel_btn.Enable(not applying)
+    
+    def on_close(self, event):
+        """Keep the dialog open until a running apply finishes."""
+        if self._apply_in_flight and event.CanVeto():
+            event.Veto()
+            return
+        event.Skip()
+    
     def on_apply(self, event):
         """Handle apply button."""
-        try:
-            if self.dhcp_radio.GetValue():
-                # Configure DHCP
-                if self.network_manager.configure_dhcp(self.iface_name):
-                    wx.MessageBox(
-                        "DHCP configuration applied successfully.",
-                        "Success",
-                        wx.OK | wx.ICON_INFORMATION
-                    )
-                    self.EndModal(wx.ID_OK)
-                else:
-                    wx.MessageBox(
-                        "Failed to configure DHCP.",
-                        "Error",
-                        wx.OK | wx.ICON_ERROR
-                    )
-            else:
-                # Configure static IP
-                ip = self.ip_text.GetValue().strip()
-                netmask = self.netmask_text.GetValue().strip()
-                gateway = self.gateway_text.GetValue().strip()
-                
-                # Validate inputs
-                if not ip:
-                    wx.MessageBox("IP address is required.", "Validation Error", wx.OK | wx.ICON_WARNING)
-                    return
-                
-                if not validate_ip_address(ip):
-                    wx.MessageBox("Invalid IP address format.", "Validation Error", wx.OK | wx.ICON_WARNING)
-                    return
-                
-                if not netmask:
-                    wx.MessageBox("Netmask is required.", "Validation Error", wx.OK | wx.ICON_WARNING)
-                    return
-                
-                if not validate_netmask(netmask):
-                    wx.MessageBox("Invalid netmask format.", "Validation Error", wx.OK | wx.ICON_WARNING)
-                    return
-                
-                if gateway and not validate_ip_address(gateway):
-                    wx.MessageBox("Invalid gateway address format.", "Validation Error", wx.OK | wx.ICON_WARNING)
-                    return
-                
-                # Apply static IP
-                if self.network_manager.configure_static_ip(self.iface_name, ip, netmask, gateway or None):
-                    wx.MessageBox(
-                        "Static IP configuration applied successfully.",
-                        "Success",
-                        wx.OK | wx.ICON_INFORMATION
-                    )
-                    self.EndModal(wx.ID_OK)
-                else:
-                    wx.MessageBox(
-                        "Failed to configure static IP.",
-                        "Error",
-                        wx.OK | wx.ICON_ERROR
-                    )
+        if self.dhcp_radio.GetValue():
+            # Configure DHCP
+            label = "DHCP"
+            apply_fn = functools.partial(self.network_manager.configure_dhcp, self.iface_name)
+        else:
+            # Configure static IP
+            ip = self.ip_text.GetValue().strip()
+            netmask = self.netmask_text.GetValue().strip()
+            gateway = self.gateway_text.GetValue().strip()
+            
+            # Validate inputs, reporting every problem at once
+            errors = []
+            
+            if not ip:
+                errors.append("IP address is required.")
+            elif not validate_ip_address(ip):
+                errors.append("Invalid IP address format.")
+            
+            if not netmask:
+                errors.append("Netmask is required.")
+            elif not validate_netmask(netmask):
+                errors.append("Invalid netmask format.")
+            
+            if gateway and not validate_ip_address(gateway):
+                errors.append("Invalid gateway address format.")
+            
+            if errors:
+                wx.MessageBox("\n".join(errors), "Validation Error", wx.OK | wx.ICON_WARNING)
+                return
+            
+            label = "static IP"
+            apply_fn = functools.partial(
+                self.network_manager.configure_static_ip,
+                self.iface_name, ip, netmask, gateway or None
+            )
+        
+        self._set_applying(True)
+        
+        # Apply in background thread
+        thread = threading.Thread(target=self._apply_in_background, args=(apply_fn, label))
+        thread.daemon = True
+        thread.start()
+    
+    def _apply_in_background(self, apply_fn, label):
+        """
+        Apply the IP configuration in background thread.
         
+        Args:
+            apply_fn: Backend call performing the configuration
+            label: Configuration kind used in messages
+        """
+        try:
+            success = apply_fn()
+            wx.CallAfter(self._handle_apply_result, success, label)
         except Exception as e:
-            self.logger.error(f"Error applying IP configuration: {e}")
+            self.logger.exception("Error applying IP configuration")
+            wx.CallAfter(self._handle_apply_error, e)
+    
+    def _handle_apply_result(self, success, label):
+        """Handle IP configuration result."""
+        self._set_applying(False)
+        
+        if success:
             wx.MessageBox(
-                f"Error applying configuration:\n{str(e)}",
+                f"{label[0].upper()}{label[1:]} configuration applied successfully.",
+                "Success",
+                wx.OK | wx.ICON_INFORMATION
+            )
+            if self.IsModal():
+                self.EndModal(wx.ID_OK)
+        else:
+            wx.MessageBox(
+                f"Failed to configure {label}.",
                 "Error",
                 wx.OK | wx.ICON_ERROR
             )
+    
+    def _handle_apply_error(self, error):
+        """Handle IP configuration error."""
+        self._set_applying(False)
+        wx.MessageBox(
+            f"Error applying configuration:\n{str(error)}",
+            "Error",
+            wx.OK | wx.ICON_ERROR
+        )
@@ -2,6 +2,7 @@
 
 import wx
 import logging
+import threading
 from .interface_panel import InterfacePanel
 from .wifi_panel import WiFiPanel
 from .dns_panel import DNSPanel
@@ -10,6 +11,7 @@ from .profile_panel import ProfilePanel
 from .diagnostics_panel import DiagnosticsPanel
 from .backup_panel import BackupPanel
 from ..backend.network_manager import NetworkManager
+from ..backend.route_monitor import RouteMonitor
 
 
 class MainWindow(wx.Frame):
@@ -26,6 +28,9 @@ class MainWindow(wx.Frame):
     - Backups
     """
     
+    # Milliseconds to wait for further refresh requests before refreshing
+    REFRESH_DEBOUNCE_MS = 300
+    
     def __init__(self):
         """Initialize the main window."""
         super().__init__(
@@ -42,7 +47,7 @@ class MainWindow(wx.Frame):
         try:
             self.network_manager = NetworkManager()
         except Exception as e:
-            self.logger.error(f"Failed to initialize network manager: {e}")
+            self.logger.exception("Failed to initialize network manager")
             wx.MessageBox(
                 f"Failed to initialize network manager:\n{str(e)}",
                 "Initialization Error",
@@ -51,14 +56,42 @@ class MainWindow(wx.Frame):
             self.Close()
             return
         
-        # Create UI components
-        self._create_menu_bar()
+        # Set while a snapshot is being collected
+        self._refresh_in_flight = False
+        
+        # Set when another refresh was requested while one was running
+        self._refresh_pending = False
+        
+        # Set when the next refresh covers every panel, not just the ones
+        # affected by interface changes
+        self._refresh_everything = False
+        
+        # Coalesces bursts of refresh requests into one
+        self._refresh_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self._do_refresh, self._refresh_timer)
+        
         self._create_status_bar()
-        self._create_notebook()
+        self.statusbar.SetStatusText("Loading...")
         
         # Center the window
         self.Centre()
         
+        # Build the rest once the event loop has shown the empty frame
+        wx.CallAfter(self._finish_init)
+    
+    def _finish_init(self):
+        """Create the menu bar and panels after the window is first shown."""
+        # Create UI components
+        self._create_menu_bar()
+        self._create_notebook()
+        self.Layout()
+        
+        # Refresh when the kernel reports interface changes
+        self.route_monitor = RouteMonitor(self._on_interface_event)
+        self.route_monitor.start()
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+        
+        self.statusbar.SetStatusText("Ready")
         self.logger.info("Main window initialized successfully")
     
     def _create_menu_bar(self):
@@ -91,77 +124,201 @@ class MainWindow(wx.Frame):
         self.statusbar.SetStatusText("Ready")
     
     def _create_notebook(self):
-        """Create the notebook with all panels."""
+        """Create the notebook; each tab's panel is built on first view."""
         panel = wx.Panel(self)
         sizer = wx.BoxSizer(wx.VERTICAL)
         
         # Create notebook
-        notebook = wx.Notebook(panel)
+        self.notebook = wx.Notebook(panel)
+        
+        # (attribute, tab label, panel class) for every tab, in order
+        self._panel_specs = [
+            ('interface_panel', "Interfaces", InterfacePanel),
+            ('wifi_panel', "WiFi", WiFiPanel),
+            ('dns_panel', "DNS", DNSPanel),
+            ('routing_panel', "Routing", RoutingPanel),
+            ('profile_panel', "Profiles", ProfilePanel),
+            ('diagnostics_panel', "Diagnostics", DiagnosticsPanel),
+            ('backup_panel', "Backups", BackupPanel),
+        ]
+        
+        # Add placeholder pages that will host the real panels
+        for attr, label, panel_class in self._panel_specs:
+            setattr(self, attr, None)
+            page = wx.Panel(self.notebook)
+            page.SetSizer(wx.BoxSizer(wx.VERTICAL))
+            self.notebook.AddPage(page, label)
         
-        # Create and add tabs
+        self.notebook.Bind(wx.EVT_NOTEBOOK_PAGE_CHANGED, self.on_page_changed)
+        
+        # The first tab is visible immediately
+        self._build_panel(0)
+        
+        sizer.Add(self.notebook, 1, wx.EXPAND | wx.ALL, 5)
+        panel.SetSizer(sizer)
+    
+    def _build_panel(self, index):
+        """
+        Create the panel for a notebook tab if not done yet.
+        
+        Args:
+            index: Notebook page index
+        """
+        attr, label, panel_class = self._panel_specs[index]
+        if getattr(self, attr) is not None:
+            return
+        
+        page = self.notebook.GetPage(index)
         try:
-            self.interface_panel = InterfacePanel(notebook, self.network_manager)
-            notebook.AddPage(self.interface_panel, "Interfaces")
-            
-            self.wifi_panel = WiFiPanel(notebook, self.network_manager)
-            notebook.AddPage(self.wifi_panel, "WiFi")
-            
-            self.dns_panel = DNSPanel(notebook, self.network_manager)
-            notebook.AddPage(self.dns_panel, "DNS")
-            
-            self.routing_panel = RoutingPanel(notebook, self.network_manager)
-            notebook.AddPage(self.routing_panel, "Routing")
-            
-            self.profile_panel = ProfilePanel(notebook, self.network_manager)
-            notebook.AddPage(self.profile_panel, "Profiles")
-            
-            self.diagnostics_panel = DiagnosticsPanel(notebook, self.network_manager)
-            notebook.AddPage(self.diagnostics_panel, "Diagnostics")
-            
-            self.backup_panel = BackupPanel(notebook, self.network_manager)
-            notebook.AddPage(self.backup_panel, "Backups")
-            
+            tab_panel = panel_class(page, self.network_manager)
         except Exception as e:
-            self.logger.error(f"Failed to create panels: {e}")
+            self.logger.exception("Failed to create %s panel", label)
             wx.MessageBox(
-                f"Failed to create interface panels:\n{str(e)}",
+                f"Failed to create {label} panel:\n{str(e)}",
                 "Error",
                 wx.OK | wx.ICON_ERROR
             )
+            return
         
-        sizer.Add(notebook, 1, wx.EXPAND | wx.ALL, 5)
-        panel.SetSizer(sizer)
+        page.GetSizer().Add(tab_panel, 1, wx.EXPAND)
+        page.Layout()
+        setattr(self, attr, tab_panel)
+    
+    def on_page_changed(self, event):
+        """Handle notebook page change."""
+        # Page changes in notebooks inside the panels bubble up to here
+        if event.GetEventObject() is self.notebook:
+            self._build_panel(event.GetSelection())
+        event.Skip()
+    
+    def _on_interface_event(self):
+        """Handle an interface change reported by the route monitor thread."""
+        self.network_manager.invalidate_interface_cache()
+        
+        # Bursts of routing messages collapse into one debounced refresh
+        wx.CallAfter(self._refresh_timer.StartOnce, self.REFRESH_DEBOUNCE_MS)
     
     def on_refresh(self, event):
         """Handle refresh menu item."""
         self.logger.info("Refreshing all panels")
         self.statusbar.SetStatusText("Refreshing...")
+        self._refresh_everything = True
+        
+        # Restarting the one-shot timer keeps only the last request
+        self._refresh_timer.StartOnce(self.REFRESH_DEBOUNCE_MS)
+    
+    def _do_refresh(self, event):
+        """Run a debounced refresh."""
+        # on_refresh() has set _refresh_everything if it asked for this one
+        self.refresh_all(network_only=True)
+    
+    def refresh_all(self, network_only=False):
+        """
+        Refresh panels from a single backend snapshot.
+        
+        Args:
+            network_only: Only refresh the interface, WiFi and routing
+                panels, which are the ones interface changes affect; a
+                full refresh requested earlier still covers every panel
+        """
+        if not network_only:
+            self._refresh_everything = True
+        
+        if self._refresh_in_flight:
+            # The running snapshot may predate the change; take another one
+            self.logger.debug("Refresh already in progress, queueing another")
+            self._refresh_pending = True
+            return
+        
+        network_only = not self._refresh_everything
+        self._refresh_everything = False
+        self._refresh_pending = False
+        self._refresh_in_flight = True
         
+        # Collect in background thread
+        thread = threading.Thread(
+            target=self._refresh_all_in_background, args=(network_only,)
+        )
+        thread.daemon = True
+        thread.start()
+    
+    def _refresh_all_in_background(self, network_only):
+        """Collect the network snapshot in background thread."""
         try:
-            self.refresh_all()
-            self.statusbar.SetStatusText("Refresh complete")
+            snap = self.network_manager.snapshot()
+            wx.CallAfter(self._apply_snapshot, snap, network_only)
         except Exception as e:
-            self.logger.error(f"Error during refresh: {e}")
-            self.statusbar.SetStatusText("Refresh failed")
-            wx.MessageBox(
-                f"Error refreshing data:\n{str(e)}",
-                "Refresh Error",
-                wx.OK | wx.ICON_ERROR
-            )
+            self.logger.exception("Error during refresh")
+            wx.CallAfter(self._handle_refresh_error, e)
     
-    def refresh_all(self):
-        """Refresh all panels."""
+    def _apply_snapshot(self, snap, network_only=False):
+        """
+        Distribute a network snapshot to the panels.
+        
+        Args:
+            snap: Dictionary returned by NetworkManager.snapshot()
+            network_only: Skip the panels interface changes do not affect
+        """
+        self._refresh_in_flight = False
+        
+        # Repaint once after all panels have updated
+        self.Freeze()
         try:
-            self.interface_panel.refresh()
-            self.wifi_panel.refresh()
-            self.dns_panel.refresh()
-            self.routing_panel.refresh()
-            self.profile_panel.refresh()
-            self.diagnostics_panel.refresh()
-            self.backup_panel.refresh()
+            # Panels not built yet load their own data when first shown
+            for panel, key in ((self.interface_panel, 'interfaces'),
+                               (self.wifi_panel, 'wifi'),
+                               (self.dns_panel, 'dns'),
+                               (self.routing_panel, 'routes')):
+                if panel is None or (network_only and key == 'dns'):
+                    continue
+                if snap[key] is None:
+                    # Let the panel query and report the error itself
+                    panel.refresh()
+                else:
+                    panel.apply_snapshot(snap[key])
+            
+            for panel in (self.profile_panel, self.diagnostics_panel,
+                          self.backup_panel):
+                if panel is not None and not network_only:
+                    panel.refresh()
+            
+            self.statusbar.SetStatusText("Refresh complete")
         except Exception as e:
-            self.logger.error(f"Error refreshing panels: {e}")
-            raise
+            self.logger.exception("Error refreshing panels")
+            self._handle_refresh_error(e)
+        finally:
+            self.Thaw()
+        
+        self._run_pending_refresh()
+    
+    def _run_pending_refresh(self):
+        """
+        Start the refresh requested while the last one was running.
+        
+        Returns:
+            True if a refresh was started
+        """
+        if not self._refresh_pending or self._refresh_in_flight:
+            return False
+        
+        self.statusbar.SetStatusText("Refreshing...")
+        self.refresh_all(network_only=True)
+        return True
+    
+    def _handle_refresh_error(self, error):
+        """Handle refresh error."""
+        self._refresh_in_flight = False
+        
+        # The queued refresh reports its own outcome
+        if self._run_pending_refresh():
+            return
+        
+        self.statusbar.SetStatusText("Refresh failed")
+        wx.MessageBox(
+            f"Error refreshing data:\n{str(error)}",
+            "Refresh Error",
+            wx.OK | wx.ICON_ERROR
+        )
     
     def on_about(self, event):
         """Show about dialog."""
@@ -185,6 +342,11 @@ class MainWindow(wx.Frame):
         
         wx.adv.AboutBox(info)
     
+    def on_close(self, event):
+        """Handle window close."""
+        self.route_monitor.stop()
+        event.Skip()
+    
     def on_exit(self, event):
         """Handle exit menu item."""
         self.logger.info("Application exit requested")
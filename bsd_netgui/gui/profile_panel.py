@@ -2,7 +2,79 @@
 
 import wx
 import logging
+import functools
+import concurrent.futures
 from ..backend.profile_manager import ProfileManager, NetworkProfile
+from ..utils.system_utils import validate_ip_address, validate_netmask
+
+# Auto-connect column text, indexed by the flag
+_YES_NO = ("No", "Yes")
+
+# Message box styles
+_ERR = wx.OK | wx.ICON_ERROR
+_OK = wx.OK | wx.ICON_INFORMATION
+_QUESTION = wx.YES_NO | wx.ICON_QUESTION
+
+# Characters replaced when suggesting an export file name
+_FNAME_TABLE = str.maketrans({' ': '_', '/': '_', ':': '_', '\\': '_'})
+
+
+class ProfileListCtrl(wx.ListCtrl):
+    """
+    Virtual list control showing one row per network profile.
+    
+    Only the rows scrolled into view are asked for their text, so the
+    cost of a refresh does not grow with the number of profiles.
+    """
+    
+    def __init__(self, parent):
+        """
+        Initialize the profile list.
+        
+        Args:
+            parent: Parent window
+        """
+        super().__init__(
+            parent,
+            style=wx.LC_REPORT | wx.LC_VIRTUAL | wx.LC_SINGLE_SEL | wx.BORDER_SUNKEN
+        )
+        self.profiles = []
+        
+        # Displayed column values of every row, to detect no-op refreshes
+        self._rows_key = ()
+    
+    def set_profiles(self, profiles):
+        """
+        Replace the displayed profiles.
+        
+        Args:
+            profiles: List of NetworkProfile objects
+        """
+        self.profiles = profiles
+        
+        rows_key = tuple(
+            (p.name, p.type, p.interface, bool(p.autoconnect)) for p in profiles
+        )
+        if rows_key == self._rows_key:
+            # Same rows as before, nothing to repaint
+            return
+        self._rows_key = rows_key
+        
+        # Resize and repaint as one update
+        self.Freeze()
+        try:
+            self.SetItemCount(len(profiles))
+            if profiles:
+                self.RefreshItems(0, len(profiles) - 1)
+        finally:
+            self.Thaw()
+    
+    def OnGetItemText(self, item, col):
+        """Return the text of a cell for the virtual list."""
+        profile = self.profiles[item]
+        if col == 3:
+            return _YES_NO[bool(profile.autoconnect)]
+        return (profile.name, profile.type, profile.interface)[col]
 
 
 class ProfilePanel(wx.Panel):
@@ -12,6 +84,9 @@ class ProfilePanel(wx.Panel):
     Provides interface to create, edit, apply, and manage network profiles.
     """
     
+    # Config keys containing any of these are masked in the details view
+    MASK_KEYS = ('password', 'psk')
+    
     def __init__(self, parent, network_manager):
         """
         Initialize the profile panel.
@@ -24,9 +99,33 @@ class ProfilePanel(wx.Panel):
         self.network_manager = network_manager
         self.logger = logging.getLogger(__name__)
         
-        # Initialize profile manager
+        # Initialize profile manager; refresh() loads the profiles
         self.profile_manager = ProfileManager()
-        self.profile_manager.load_profiles()
+        
+        # Profile file I/O runs here so slow disks never block the UI; a
+        # single worker keeps loads, saves and applies from overlapping
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="profile"
+        )
+        self.Bind(wx.EVT_WINDOW_DESTROY, self.on_destroy)
+        
+        # Set while profiles are being loaded, and when another load was
+        # requested in the meantime
+        self._refresh_in_flight = False
+        self._refresh_pending = False
+        
+        # Set while a profile is being applied to the config files
+        self._apply_in_flight = False
+        
+        # Profiles in list order, as last loaded, and their row by name
+        self._profiles_cache = []
+        self._profile_index_by_name = {}
+        
+        # Details text by profile name: {name: (profile, details)}
+        self._details_cache = {}
+        
+        # Template names offered by the new profile wizard
+        self._template_list = ProfileManager.get_available_templates()
         
         self._create_ui()
         self.refresh()
@@ -47,16 +146,14 @@ class ProfilePanel(wx.Panel):
         list_box = wx.StaticBox(self, label="Saved Profiles")
         list_sizer = wx.StaticBoxSizer(list_box, wx.VERTICAL)
         
-        self.profile_list = wx.ListCtrl(
-            self,
-            style=wx.LC_REPORT | wx.LC_SINGLE_SEL | wx.BORDER_SUNKEN
-        )
+        self.profile_list = ProfileListCtrl(self)
         self.profile_list.AppendColumn("Profile Name", width=200)
         self.profile_list.AppendColumn("Type", width=100)
         self.profile_list.AppendColumn("Interface", width=100)
         self.profile_list.AppendColumn("Auto-Connect", width=100)
         
         self.profile_list.Bind(wx.EVT_LIST_ITEM_SELECTED, self.on_profile_selected)
+        self.profile_list.Bind(wx.EVT_LIST_ITEM_DESELECTED, self.on_profile_deselected)
         self.profile_list.Bind(wx.EVT_LIST_ITEM_ACTIVATED, self.on_apply_profile)
         list_sizer.Add(self.profile_list, 1, wx.EXPAND | wx.ALL, 5)
         
@@ -118,28 +215,99 @@ class ProfilePanel(wx.Panel):
         
         self.SetSizer(main_sizer)
     
+    def on_destroy(self, event):
+        """Stop accepting background work once the panel is destroyed."""
+        if event.GetEventObject() is self:
+            self._executor.shutdown(wait=False)
+        event.Skip()
+    
+    def _submit(self, fn, on_done, *args, **kwargs):
+        """
+        Call a blocking function on the panel's worker thread.
+        
+        Args:
+            fn: Function to call
+            on_done: Called in the main thread as on_done(result, error),
+                where exactly one of result and error is meaningful
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+        """
+        def done(future):
+            error = future.exception()
+            result = None if error is not None else future.result()
+            wx.CallAfter(on_done, result, error)
+        
+        self._executor.submit(fn, *args, **kwargs).add_done_callback(done)
+    
     def refresh(self):
         """Refresh the profile list."""
+        if self._refresh_in_flight:
+            # Reload again once the running load finishes
+            self._refresh_pending = True
+            return
+        
         self.logger.info("Refreshing profile list")
-        self.profile_list.DeleteAllItems()
+        self._refresh_in_flight = True
+        self._submit(self._load_profiles, self._populate_list)
+    
+    def _load_profiles(self):
+        """
+        Load profiles from disk in a worker thread.
         
-        try:
-            self.profile_manager.load_profiles()
-            profiles = self.profile_manager.list_profiles()
-            
-            for profile in profiles:
-                index = self.profile_list.GetItemCount()
-                self.profile_list.InsertItem(index, profile.name)
-                self.profile_list.SetItem(index, 1, profile.type)
-                self.profile_list.SetItem(index, 2, profile.interface)
-                self.profile_list.SetItem(index, 3, "Yes" if profile.autoconnect else "No")
-        except Exception as e:
-            self.logger.error(f"Error refreshing profiles: {e}")
-            wx.MessageBox(
-                f"Error loading profiles:\n{str(e)}",
-                "Error",
-                wx.OK | wx.ICON_ERROR
-            )
+        Returns:
+            List of NetworkProfile objects
+        """
+        self.profile_manager.load_profiles()
+        return self.profile_manager.list_profiles()
+    
+    def _populate_list(self, profiles, error):
+        """
+        Show loaded profiles in the main thread.
+        
+        Args:
+            profiles: List of NetworkProfile objects
+            error: Exception raised while loading, or None
+        """
+        self._refresh_in_flight = False
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self.refresh()
+            return
+        
+        if error is not None:
+            self._profiles_cache = []
+            self._profile_index_by_name = {}
+            self.profile_list.set_profiles(self._profiles_cache)
+            self._set_selection_state(False)
+            self.logger.error(f"Error refreshing profiles: {error}")
+            self._notify(f"Error loading profiles:\n{str(error)}", ok=False)
+            return
+        
+        # Rows may have moved, so follow the selected profile by name
+        old_index = self.profile_list.GetFirstSelected()
+        selected_name = None
+        if 0 <= old_index < len(self._profiles_cache):
+            selected_name = self._profiles_cache[old_index].name
+        
+        self._profiles_cache = profiles
+        self._profile_index_by_name = {
+            profile.name: index for index, profile in reversed(list(enumerate(profiles)))
+        }
+        self.profile_list.set_profiles(profiles)
+        
+        new_index = self._profile_index_by_name.get(selected_name, -1)
+        if new_index != old_index:
+            if 0 <= old_index < len(profiles):
+                self.profile_list.Select(old_index, False)
+            if new_index != -1:
+                self.profile_list.Select(new_index)
+        
+        # No selection event fires when the row stays put, but the profile
+        # itself may have been edited
+        if new_index != -1:
+            self.details_text.SetValue(self._get_details(profiles[new_index]))
+        
+        self._set_selection_state(new_index != -1)
     
     def on_profile_selected(self, event):
         """Handle profile selection."""
@@ -147,54 +315,134 @@ class ProfilePanel(wx.Panel):
         if index == -1:
             return
         
-        profile_name = self.profile_list.GetItemText(index, 0)
-        profile = self.profile_manager.get_profile(profile_name)
+        profile = self._profiles_cache[index]
         
         if profile:
             # Display profile details
-            details = f"Profile: {profile.name}\n"
-            details += f"Type: {profile.type}\n"
-            details += f"Interface: {profile.interface}\n"
-            details += f"Auto-Connect: {'Yes' if profile.autoconnect else 'No'}\n"
-            details += f"\nConfiguration:\n"
-            for key, value in profile.config.items():
-                # Mask passwords
-                if 'password' in key.lower() or 'psk' in key.lower():
-                    value = '*' * 8
-                details += f"  {key}: {value}\n"
-            
-            self.details_text.SetValue(details)
-            
-            # Enable buttons
-            self.edit_btn.Enable(True)
-            self.apply_btn.Enable(True)
-            self.delete_btn.Enable(True)
-            self.export_btn.Enable(True)
+            self.details_text.SetValue(self._get_details(profile))
+            self._set_selection_state(True)
+    
+    def on_profile_deselected(self, event):
+        """Handle profile deselection."""
+        self.details_text.Clear()
+        self._set_selection_state(False)
+    
+    def _set_selection_state(self, has_selection):
+        """
+        Enable or disable the buttons that act on the selected profile.
+        
+        Args:
+            has_selection: True if a profile is selected
+        """
+        self.Freeze()
+        try:
+            for button in (self.edit_btn, self.delete_btn, self.export_btn):
+                button.Enable(has_selection)
+            self.apply_btn.Enable(has_selection and not self._apply_in_flight)
+        finally:
+            self.Thaw()
+    
+    def _notify(self, message, ok=True):
+        """
+        Report the outcome of a profile operation.
+        
+        Args:
+            message: Message to show
+            ok: True for a success message, False for an error
+        """
+        dialog = wx.MessageDialog(
+            self,
+            message,
+            "Success" if ok else "Error",
+            _OK if ok else _ERR
+        )
+        dialog.ShowModal()
+        dialog.Destroy()
+    
+    def _get_details(self, profile):
+        """
+        Get the details text for a profile, building it on first use.
+        
+        Args:
+            profile: NetworkProfile to describe
+        
+        Returns:
+            Details text with secrets masked
+        """
+        # A reload or edit replaces the profile object, making the entry stale
+        cached = self._details_cache.get(profile.name)
+        if cached and cached[0] is profile:
+            return cached[1]
+        
+        lines = [
+            f"Profile: {profile.name}",
+            f"Type: {profile.type}",
+            f"Interface: {profile.interface}",
+            f"Auto-Connect: {_YES_NO[bool(profile.autoconnect)]}",
+            "",
+            "Configuration:",
+        ]
+        # Mask passwords
+        lines += [f"  {key}: {'*' * 8 if self._is_secret(key) else value}"
+                  for key, value in profile.config.items()]
+        
+        details = "\n".join(lines)
+        self._details_cache[profile.name] = (profile, details)
+        return details
+    
+    @classmethod
+    def _is_secret(cls, key):
+        """
+        Check whether a config value must be masked.
+        
+        Args:
+            key: Config key
+        
+        Returns:
+            True if the key names a password or pre-shared key
+        """
+        key_lower = key.lower()
+        return any(mask in key_lower for mask in cls.MASK_KEYS)
     
     def on_refresh(self, event):
         """Handle refresh button click."""
         self.refresh()
     
+    def _handle_change_result(self, message, failure, success, error):
+        """
+        Report the outcome of saving, renaming or deleting a profile.
+        
+        Args:
+            message: Message to show on success
+            failure: Message to show when the operation returned False
+            success: Result of the ProfileManager call
+            error: Exception raised by the call, or None
+        """
+        if error is not None:
+            self.logger.error(f"Error updating profiles: {error}")
+            self._notify(f"{failure}\n{str(error)}", ok=False)
+        elif success:
+            self._notify(message)
+            self.refresh()
+        else:
+            self._notify(failure, ok=False)
+    
     def on_new_profile(self, event):
         """Handle new profile button click."""
-        dialog = ProfileWizardDialog(self, self.profile_manager)
+        dialog = ProfileWizardDialog(self, self.profile_manager, templates=self._template_list)
         if dialog.ShowModal() == wx.ID_OK:
             profile = dialog.get_profile()
             if profile:
                 # Save profile
-                if self.profile_manager.save_profile(profile):
-                    wx.MessageBox(
+                self._submit(
+                    self.profile_manager.save_profile,
+                    functools.partial(
+                        self._handle_change_result,
                         f"Profile '{profile.name}' created successfully!",
-                        "Success",
-                        wx.OK | wx.ICON_INFORMATION
-                    )
-                    self.refresh()
-                else:
-                    wx.MessageBox(
-                        "Failed to save profile.",
-                        "Error",
-                        wx.OK | wx.ICON_ERROR
-                    )
+                        "Failed to save profile."
+                    ),
+                    profile
+                )
         dialog.Destroy()
     
     def on_edit_profile(self, event):
@@ -203,42 +451,41 @@ class ProfilePanel(wx.Panel):
         if index == -1:
             return
         
-        profile_name = self.profile_list.GetItemText(index, 0)
-        profile = self.profile_manager.get_profile(profile_name)
+        profile = self._profiles_cache[index]
         
         if profile:
             dialog = ProfileWizardDialog(self, self.profile_manager, profile)
             if dialog.ShowModal() == wx.ID_OK:
                 updated_profile = dialog.get_profile()
                 if updated_profile:
-                    # Delete old profile if name changed
-                    if profile.name != updated_profile.name:
-                        self.profile_manager.delete_profile(profile.name)
+                    self._details_cache.pop(profile.name, None)
                     
-                    # Save updated profile
-                    if self.profile_manager.save_profile(updated_profile):
-                        wx.MessageBox(
-                            f"Profile '{updated_profile.name}' updated successfully!",
-                            "Success",
-                            wx.OK | wx.ICON_INFORMATION
-                        )
-                        self.refresh()
+                    on_done = functools.partial(
+                        self._handle_change_result,
+                        f"Profile '{updated_profile.name}' updated successfully!",
+                        "Failed to save profile."
+                    )
+                    
+                    # Move the old file over if the name changed
+                    if profile.name != updated_profile.name:
+                        self._submit(self.profile_manager.rename_profile, on_done,
+                                     profile.name, updated_profile)
                     else:
-                        wx.MessageBox(
-                            "Failed to save profile.",
-                            "Error",
-                            wx.OK | wx.ICON_ERROR
-                        )
+                        self._submit(self.profile_manager.save_profile, on_done,
+                                     updated_profile)
             dialog.Destroy()
     
     def on_apply_profile(self, event):
         """Handle apply profile button click."""
+        # Double-clicking a row bypasses the disabled button
+        if self._apply_in_flight:
+            return
+        
         index = self.profile_list.GetFirstSelected()
         if index == -1:
             return
         
-        profile_name = self.profile_list.GetItemText(index, 0)
-        profile = self.profile_manager.get_profile(profile_name)
+        profile = self._profiles_cache[index]
         
         if profile:
             # Confirm action
@@ -247,30 +494,43 @@ class ProfilePanel(wx.Panel):
                 f"This will modify network configuration files.\n"
                 f"A backup will be created automatically.",
                 "Confirm Profile Application",
-                wx.YES_NO | wx.ICON_QUESTION
+                _QUESTION
             )
             
             if result == wx.YES:
-                try:
-                    if self.profile_manager.apply_profile(profile, backup=True):
-                        wx.MessageBox(
-                            f"Profile '{profile.name}' applied successfully!\n\n"
-                            f"You may need to restart network services or reboot.",
-                            "Success",
-                            wx.OK | wx.ICON_INFORMATION
-                        )
-                    else:
-                        wx.MessageBox(
-                            "Failed to apply profile. Check logs for details.",
-                            "Error",
-                            wx.OK | wx.ICON_ERROR
-                        )
-                except Exception as e:
-                    wx.MessageBox(
-                        f"Error applying profile:\n{str(e)}",
-                        "Error",
-                        wx.OK | wx.ICON_ERROR
-                    )
+                # Backing up and rewriting the config files can take a while
+                self._apply_in_flight = True
+                self.apply_btn.Enable(False)
+                wx.BeginBusyCursor()
+                self._submit(
+                    self.profile_manager.apply_profile,
+                    functools.partial(self._handle_apply_result, profile),
+                    profile,
+                    backup=True
+                )
+    
+    def _handle_apply_result(self, profile, success, error):
+        """
+        Report the outcome of applying a profile.
+        
+        Args:
+            profile: Profile that was applied
+            success: Result of ProfileManager.apply_profile()
+            error: Exception raised while applying, or None
+        """
+        wx.EndBusyCursor()
+        self._apply_in_flight = False
+        self.apply_btn.Enable(self.profile_list.GetFirstSelected() != -1)
+        
+        if error is not None:
+            self._notify(f"Error applying profile:\n{str(error)}", ok=False)
+        elif success:
+            self._notify(
+                f"Profile '{profile.name}' applied successfully!\n\n"
+                f"You may need to restart network services or reboot."
+            )
+        else:
+            self._notify("Failed to apply profile. Check logs for details.", ok=False)
     
     def on_delete_profile(self, event):
         """Handle delete profile button click."""
@@ -278,7 +538,7 @@ class ProfilePanel(wx.Panel):
         if index == -1:
             return
         
-        profile_name = self.profile_list.GetItemText(index, 0)
+        profile_name = self._profiles_cache[index].name
         
         # Confirm deletion
         result = wx.MessageBox(
@@ -288,56 +548,71 @@ class ProfilePanel(wx.Panel):
         )
         
         if result == wx.YES:
-            if self.profile_manager.delete_profile(profile_name):
-                wx.MessageBox(
+            self._details_cache.pop(profile_name, None)
+            self._submit(
+                self.profile_manager.delete_profile,
+                functools.partial(
+                    self._handle_change_result,
                     f"Profile '{profile_name}' deleted successfully!",
-                    "Success",
-                    wx.OK | wx.ICON_INFORMATION
-                )
-                self.refresh()
-            else:
-                wx.MessageBox(
-                    "Failed to delete profile.",
-                    "Error",
-                    wx.OK | wx.ICON_ERROR
-                )
+                    "Failed to delete profile."
+                ),
+                profile_name
+            )
     
     def on_import_profile(self, event):
         """Handle import profile button click."""
         wildcard = "JSON files (*.json)|*.json|All files (*.*)|*.*"
-        dialog = wx.FileDialog(
+        with wx.FileDialog(
             self,
             "Import Profile",
             wildcard=wildcard,
             style=wx.FD_OPEN | wx.FD_FILE_MUST_EXIST
-        )
-        
-        if dialog.ShowModal() == wx.ID_OK:
+        ) as dialog:
+            if dialog.ShowModal() != wx.ID_OK:
+                return
             path = dialog.GetPath()
-            profile = self.profile_manager.import_profile(path)
-            if profile:
-                # Save imported profile
-                if self.profile_manager.save_profile(profile):
-                    wx.MessageBox(
-                        f"Profile '{profile.name}' imported successfully!",
-                        "Success",
-                        wx.OK | wx.ICON_INFORMATION
-                    )
-                    self.refresh()
-                else:
-                    wx.MessageBox(
-                        "Failed to save imported profile.",
-                        "Error",
-                        wx.OK | wx.ICON_ERROR
-                    )
-            else:
-                wx.MessageBox(
-                    "Failed to import profile. Invalid file format.",
-                    "Error",
-                    wx.OK | wx.ICON_ERROR
-                )
         
-        dialog.Destroy()
+        self.import_btn.Enable(False)
+        self._submit(self._import_profile, self._handle_import_result, path)
+    
+    def _import_profile(self, path):
+        """
+        Import and save a profile in a worker thread.
+        
+        Args:
+            path: Path of the profile file to import
+        
+        Returns:
+            Tuple of (profile, saved); profile is None if the file was invalid
+        """
+        profile = self.profile_manager.import_profile(path)
+        if not profile:
+            return None, False
+        return profile, self.profile_manager.save_profile(profile)
+    
+    def _handle_import_result(self, result, error):
+        """
+        Report the outcome of importing a profile.
+        
+        Args:
+            result: Tuple returned by _import_profile()
+            error: Exception raised while importing, or None
+        """
+        self.import_btn.Enable(True)
+        
+        if error is not None:
+            self.logger.error(f"Error importing profile: {error}")
+            self._notify(f"Error importing profile:\n{str(error)}", ok=False)
+            return
+        
+        profile, saved = result
+        if profile and saved:
+            self._notify(f"Profile '{profile.name}' imported successfully!")
+            self.refresh()
+        elif profile:
+            self._notify("Failed to save imported profile.", ok=False)
+        else:
+            self._notify("Failed to import profile. Invalid file format.", ok=False)
     
     def on_export_profile(self, event):
         """Handle export profile button click."""
@@ -345,41 +620,53 @@ class ProfilePanel(wx.Panel):
         if index == -1:
             return
         
-        profile_name = self.profile_list.GetItemText(index, 0)
-        profile = self.profile_manager.get_profile(profile_name)
+        profile = self._profiles_cache[index]
         
         if profile:
             wildcard = "JSON files (*.json)|*.json|All files (*.*)|*.*"
-            dialog = wx.FileDialog(
+            with wx.FileDialog(
                 self,
                 "Export Profile",
-                defaultFile=f"{profile_name.replace(' ', '_')}.json",
+                defaultFile=f"{profile.name.translate(_FNAME_TABLE)}.json",
                 wildcard=wildcard,
                 style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT
-            )
-            
-            if dialog.ShowModal() == wx.ID_OK:
+            ) as dialog:
+                if dialog.ShowModal() != wx.ID_OK:
+                    return
                 path = dialog.GetPath()
-                if self.profile_manager.export_profile(profile, path):
-                    wx.MessageBox(
-                        f"Profile '{profile.name}' exported successfully!",
-                        "Success",
-                        wx.OK | wx.ICON_INFORMATION
-                    )
-                else:
-                    wx.MessageBox(
-                        "Failed to export profile.",
-                        "Error",
-                        wx.OK | wx.ICON_ERROR
-                    )
             
-            dialog.Destroy()
+            self.export_btn.Enable(False)
+            self._submit(
+                self.profile_manager.export_profile,
+                functools.partial(self._handle_export_result, profile),
+                profile,
+                path
+            )
+    
+    def _handle_export_result(self, profile, success, error):
+        """
+        Report the outcome of exporting a profile.
+        
+        Args:
+            profile: Profile that was exported
+            success: Result of ProfileManager.export_profile()
+            error: Exception raised while exporting, or None
+        """
+        self.export_btn.Enable(self.profile_list.GetFirstSelected() != -1)
+        
+        if error is not None:
+            self.logger.error(f"Error exporting profile: {error}")
+            self._notify(f"Error exporting profile:\n{str(error)}", ok=False)
+        elif success:
+            self._notify(f"Profile '{profile.name}' exported successfully!")
+        else:
+            self._notify("Failed to export profile.", ok=False)
 
 
 class ProfileWizardDialog(wx.Dialog):
     """Dialog for creating/editing network profiles."""
     
-    def __init__(self, parent, profile_manager, profile=None):
+    def __init__(self, parent, profile_manager, profile=None, templates=None):
         """
         Initialize the profile wizard dialog.
         
@@ -387,14 +674,23 @@ class ProfileWizardDialog(wx.Dialog):
             parent: Parent window
             profile_manager: ProfileManager instance
             profile: Existing profile to edit (None for new profile)
+            templates: Template names to offer (None for all built-in ones)
         """
         title = "Edit Profile" if profile else "New Profile"
         super().__init__(parent, title=title, size=(500, 600))
         
         self.profile_manager = profile_manager
         self.existing_profile = profile
+        self.templates = templates
         self.logger = logging.getLogger(__name__)
         
+        # Type-specific config panels, created when first shown
+        self.ethernet_panel = None
+        self.wifi_panel = None
+        
+        # Config book page of each created panel: {"ethernet"|"wifi": index}
+        self._page_index = {}
+        
         self._create_ui()
         
         # Load existing profile data
@@ -417,7 +713,9 @@ class ProfileWizardDialog(wx.Dialog):
             template_label = wx.StaticText(self, label="Start from Template (optional):")
             main_sizer.Add(template_label, 0, wx.ALL, 5)
             
-            templates = ["None"] + ProfileManager.get_available_templates()
+            if self.templates is None:
+                self.templates = ProfileManager.get_available_templates()
+            templates = ["None"] + self.templates
             self.template_choice = wx.Choice(self, choices=templates)
             self.template_choice.SetSelection(0)
             self.template_choice.Bind(wx.EVT_CHOICE, self.on_template_selected)
@@ -448,14 +746,15 @@ class ProfileWizardDialog(wx.Dialog):
         config_box = wx.StaticBox(self, label="Configuration")
         self.config_sizer = wx.StaticBoxSizer(config_box, wx.VERTICAL)
         
-        main_sizer.Add(self.config_sizer, 1, wx.EXPAND | wx.ALL, 5)
+        # One page per connection kind, only the selected one is shown
+        self.config_book = wx.Simplebook(self)
+        self.config_sizer.Add(self.config_book, 1, wx.EXPAND)
         
-        # Create config panels
-        self._create_ethernet_config()
-        self._create_wifi_config()
+        main_sizer.Add(self.config_sizer, 1, wx.EXPAND | wx.ALL, 5)
         
-        # Show appropriate panel
-        self._show_config_panel("ethernet")
+        # Show appropriate panel, creating only that one for now
+        initial_type = self.existing_profile.type if self.existing_profile else "ethernet"
+        self._show_config_panel(initial_type)
         
         # Dialog buttons
         button_sizer = wx.StdDialogButtonSizer()
@@ -474,7 +773,7 @@ class ProfileWizardDialog(wx.Dialog):
     
     def _create_ethernet_config(self):
         """Create Ethernet configuration panel."""
-        self.ethernet_panel = wx.Panel(self)
+        self.ethernet_panel = wx.Panel(self.config_book)
         ethernet_sizer = wx.BoxSizer(wx.VERTICAL)
         
         # DHCP checkbox
@@ -507,13 +806,14 @@ class ProfileWizardDialog(wx.Dialog):
         ethernet_sizer.Add(self.static_panel, 0, wx.EXPAND | wx.ALL, 5)
         
         self.ethernet_panel.SetSizer(ethernet_sizer)
-        self.config_sizer.Add(self.ethernet_panel, 1, wx.EXPAND)
+        self._page_index["ethernet"] = self.config_book.GetPageCount()
+        self.config_book.AddPage(self.ethernet_panel, "Ethernet")
         
         self.on_dhcp_changed(None)
     
     def _create_wifi_config(self):
         """Create WiFi configuration panel."""
-        self.wifi_panel = wx.Panel(self)
+        self.wifi_panel = wx.Panel(self.config_book)
         wifi_sizer = wx.BoxSizer(wx.VERTICAL)
         
         # SSID
@@ -546,8 +846,8 @@ class ProfileWizardDialog(wx.Dialog):
         wifi_sizer.Add(self.wifi_dhcp_check, 0, wx.ALL, 5)
         
         self.wifi_panel.SetSizer(wifi_sizer)
-        self.config_sizer.Add(self.wifi_panel, 1, wx.EXPAND)
-        self.wifi_panel.Hide()
+        self._page_index["wifi"] = self.config_book.GetPageCount()
+        self.config_book.AddPage(self.wifi_panel, "WiFi")
         
         self.on_security_changed(None)
     
@@ -570,14 +870,19 @@ class ProfileWizardDialog(wx.Dialog):
     
     def _show_config_panel(self, conn_type):
         """Show the appropriate configuration panel."""
-        if conn_type == "wifi":
-            self.ethernet_panel.Hide()
-            self.wifi_panel.Show()
-        else:
-            self.wifi_panel.Hide()
-            self.ethernet_panel.Show()
+        # Tethering is configured like ethernet
+        kind = "wifi" if conn_type == "wifi" else "ethernet"
         
-        self.Layout()
+        if kind not in self._page_index:
+            if kind == "wifi":
+                self._create_wifi_config()
+            else:
+                self._create_ethernet_config()
+            
+            # A new page may need more room than the book has
+            self.Layout()
+        
+        self.config_book.SetSelection(self._page_index[kind])
     
     def on_dhcp_changed(self, event):
         """Handle DHCP checkbox change."""
@@ -617,14 +922,14 @@ class ProfileWizardDialog(wx.Dialog):
         # Validate inputs
         name = self.name_text.GetValue().strip()
         if not name:
-            wx.MessageBox("Please enter a profile name.", "Validation Error", wx.OK | wx.ICON_ERROR)
+            wx.MessageBox("Please enter a profile name.", "Validation Error", _ERR)
             return
         
         conn_type = self.type_choice.GetStringSelection()
         interface = self.interface_text.GetValue().strip()
         
         if not interface:
-            wx.MessageBox("Please enter an interface name.", "Validation Error", wx.OK | wx.ICON_ERROR)
+            wx.MessageBox("Please enter an interface name.", "Validation Error", _ERR)
             return
         
         # Create profile
@@ -638,7 +943,7 @@ class ProfileWizardDialog(wx.Dialog):
         if conn_type == "wifi":
             ssid = self.ssid_text.GetValue().strip()
             if not ssid:
-                wx.MessageBox("Please enter a network SSID.", "Validation Error", wx.OK | wx.ICON_ERROR)
+                wx.MessageBox("Please enter a network SSID.", "Validation Error", _ERR)
                 return
             
             profile.config = {
@@ -653,18 +958,16 @@ class ProfileWizardDialog(wx.Dialog):
             profile.config = {'dhcp': use_dhcp}
             
             if not use_dhcp:
-                from ..utils.system_utils import validate_ip_address, validate_netmask
-                
                 ip = self.ip_text.GetValue().strip()
                 netmask = self.netmask_text.GetValue().strip()
                 gateway = self.gateway_text.GetValue().strip()
                 
                 if not ip or not validate_ip_address(ip):
-                    wx.MessageBox("Please enter a valid IP address.", "Validation Error", wx.OK | wx.ICON_ERROR)
+                    wx.MessageBox("Please enter a valid IP address.", "Validation Error", _ERR)
                     return
                 
                 if not netmask or not validate_netmask(netmask):
-                    wx.MessageBox("Please enter a valid netmask.", "Validation Error", wx.OK | wx.ICON_ERROR)
+                    wx.MessageBox("Please enter a valid netmask.", "Validation Error", _ERR)
                     return
                 
                 profile.config['ip'] = ip
@@ -672,7 +975,7 @@ class ProfileWizardDialog(wx.Dialog):
                 
                 if gateway:
                     if not validate_ip_address(gateway):
-                        wx.MessageBox("Please enter a valid gateway IP.", "Validation Error", wx.OK | wx.ICON_ERROR)
+                        wx.MessageBox("Please enter a valid gateway IP.", "Validation Error", _ERR)
                         return
                     profile.config['gateway'] = gateway
         
@@ -2,9 +2,90 @@
 
 import wx
 import logging
+import threading
 from ..utils.system_utils import validate_ip_address, validate_netmask
 
 
+# Help text font, created from the first help label that needs it
+_SMALL_FONT = None
+
+
+def _get_small_font(ref_widget):
+    """
+    Get a font one point smaller than a widget's default font.
+    
+    Args:
+        ref_widget: Widget whose font the small font is derived from
+    
+    Returns:
+        Shared wx.Font instance
+    """
+    global _SMALL_FONT
+    if _SMALL_FONT is None:
+        font = ref_widget.GetFont()
+        font.SetPointSize(font.GetPointSize() - 1)
+        _SMALL_FONT = font
+    return _SMALL_FONT
+
+
+class RouteListCtrl(wx.ListCtrl):
+    """
+    Virtual list control showing one row per route.
+    
+    Cell text is read on demand from the route dictionaries, so large
+    routing tables only cost work for the rows scrolled into view.
+    """
+    
+    # (route dictionary key, header, width) of each column
+    COLUMNS = (
+        ('destination', "Destination", 150),
+        ('gateway', "Gateway", 150),
+        ('flags', "Flags", 100),
+        ('interface', "Interface", 100),
+        ('metric', "Metric", 80),
+    )
+    
+    # Dictionary key of each column, indexed by column number
+    _KEYS = tuple(key for key, header, width in COLUMNS)
+    
+    def __init__(self, parent):
+        """
+        Initialize the route list.
+        
+        Args:
+            parent: Parent window
+        """
+        super().__init__(
+            parent,
+            style=wx.LC_REPORT | wx.LC_VIRTUAL | wx.LC_SINGLE_SEL | wx.BORDER_SUNKEN
+        )
+        for key, header, width in self.COLUMNS:
+            self.AppendColumn(header, width=width)
+        self.routes = []
+    
+    def set_routes(self, routes):
+        """
+        Replace the displayed routes.
+        
+        Args:
+            routes: List of route dictionaries
+        """
+        self.routes = routes
+        
+        # Resize and repaint as one update
+        self.Freeze()
+        try:
+            self.SetItemCount(len(routes))
+            if routes:
+                self.RefreshItems(0, len(routes) - 1)
+        finally:
+            self.Thaw()
+    
+    def OnGetItemText(self, item, col):
+        """Return the text of a cell for the virtual list."""
+        return self.routes[item].get(self._KEYS[col], '')
+
+
 class RoutingPanel(wx.Panel):
     """
     Panel for managing routing tables.
@@ -24,6 +105,17 @@ class RoutingPanel(wx.Panel):
         self.network_manager = network_manager
         self.logger = logging.getLogger(__name__)
         
+        # Set while the routing table is being fetched; the generation is
+        # bumped whenever newer routes are shown, so stale fetches are dropped
+        self._refresh_in_flight = False
+        self._refresh_gen = 0
+        
+        # Set when a refresh was requested while a fetch was running
+        self._refresh_pending = False
+        
+        # Add route dialog, created on first use and reused afterwards
+        self._add_route_dialog = None
+        
         self._create_ui()
         self.refresh()
     
@@ -40,24 +132,16 @@ class RoutingPanel(wx.Panel):
         list_label = wx.StaticText(self, label="Routing Table:")
         main_sizer.Add(list_label, 0, wx.ALL, 5)
         
-        self.route_list = wx.ListCtrl(
-            self,
-            style=wx.LC_REPORT | wx.LC_SINGLE_SEL | wx.BORDER_SUNKEN
-        )
-        self.route_list.AppendColumn("Destination", width=150)
-        self.route_list.AppendColumn("Gateway", width=150)
-        self.route_list.AppendColumn("Flags", width=100)
-        self.route_list.AppendColumn("Interface", width=100)
-        self.route_list.AppendColumn("Metric", width=80)
+        self.route_list = RouteListCtrl(self)
         
         main_sizer.Add(self.route_list, 1, wx.EXPAND | wx.ALL, 5)
         
         # Buttons
         button_sizer = wx.BoxSizer(wx.HORIZONTAL)
         
-        refresh_btn = wx.Button(self, label="Refresh")
-        refresh_btn.Bind(wx.EVT_BUTTON, self.on_refresh)
-        button_sizer.Add(refresh_btn, 0, wx.ALL, 5)
+        self.refresh_btn = wx.Button(self, label="Refresh")
+        self.refresh_btn.Bind(wx.EVT_BUTTON, self.on_refresh)
+        button_sizer.Add(self.refresh_btn, 0, wx.ALL, 5)
         
         add_route_btn = wx.Button(self, label="Add Route")
         add_route_btn.Bind(wx.EVT_BUTTON, self.on_add_route)
@@ -72,30 +156,90 @@ class RoutingPanel(wx.Panel):
         self.SetSizer(main_sizer)
     
     def refresh(self):
-        """Refresh the routing table."""
+        """Refresh the routing table without blocking the UI."""
+        if self._refresh_in_flight:
+            # The running fetch may predate a change; fetch again after it
+            self._refresh_gen += 1
+            self._refresh_pending = True
+            return
+        
         self.logger.info("Refreshing routing table")
-        self.route_list.DeleteAllItems()
+        self._refresh_in_flight = True
+        self.refresh_btn.Enable(False)
         
+        # Fetch in background thread
+        thread = threading.Thread(
+            target=self._refresh_in_background, args=(self._refresh_gen,)
+        )
+        thread.daemon = True
+        thread.start()
+    
+    def _refresh_in_background(self, gen):
+        """
+        Fetch the routing table in background thread.
+        
+        Args:
+            gen: Refresh generation the fetch was started for
+        """
         try:
             routes = self.network_manager.get_routing_table()
-            
-            for route in routes:
-                index = self.route_list.GetItemCount()
-                self.route_list.InsertItem(index, route.get('destination', ''))
-                self.route_list.SetItem(index, 1, route.get('gateway', ''))
-                self.route_list.SetItem(index, 2, route.get('flags', ''))
-                self.route_list.SetItem(index, 3, route.get('interface', ''))
-                self.route_list.SetItem(index, 4, route.get('metric', ''))
-            
-            self.logger.info(f"Loaded {len(routes)} routes")
-            
+            wx.CallAfter(self._populate, gen, routes)
         except Exception as e:
-            self.logger.error(f"Error refreshing routing table: {e}")
-            wx.MessageBox(
-                f"Error loading routing table:\n{str(e)}",
-                "Error",
-                wx.OK | wx.ICON_ERROR
-            )
+            wx.CallAfter(self._handle_refresh_error, gen, e)
+    
+    def _populate(self, gen, routes):
+        """
+        Show a fetched routing table in the main thread.
+        
+        Args:
+            gen: Refresh generation the fetch was started for
+            routes: List of route dictionaries
+        """
+        self._refresh_in_flight = False
+        self.refresh_btn.Enable(True)
+        
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self.refresh()
+            return
+        
+        if gen != self._refresh_gen:
+            self.logger.debug("Discarding stale routing table")
+            return
+        
+        self.apply_snapshot(routes)
+    
+    def _handle_refresh_error(self, gen, error):
+        """Handle routing table refresh error."""
+        self._refresh_in_flight = False
+        self.refresh_btn.Enable(True)
+        
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self.refresh()
+            return
+        
+        if gen != self._refresh_gen:
+            return
+        
+        self.logger.error(f"Error refreshing routing table: {error}")
+        wx.MessageBox(
+            f"Error loading routing table:\n{str(error)}",
+            "Error",
+            wx.OK | wx.ICON_ERROR
+        )
+    
+    def apply_snapshot(self, routes):
+        """
+        Show a routing table collected elsewhere.
+        
+        Args:
+            routes: List of route dictionaries
+        """
+        # Anything fetched before this point is now out of date
+        self._refresh_gen += 1
+        self.route_list.set_routes(routes)
+        self.logger.info(f"Loaded {len(routes)} routes")
     
     def on_refresh(self, event):
         """Handle refresh button."""
@@ -103,10 +247,13 @@ class RoutingPanel(wx.Panel):
     
     def on_add_route(self, event):
         """Handle add route button."""
-        dialog = AddRouteDialog(self, self.network_manager)
-        if dialog.ShowModal() == wx.ID_OK:
+        if self._add_route_dialog is None:
+            self._add_route_dialog = AddRouteDialog(self, self.network_manager)
+        else:
+            self._add_route_dialog.reset()
+        
+        if self._add_route_dialog.ShowModal() == wx.ID_OK:
             self.refresh()
-        dialog.Destroy()
     
     def on_delete_route(self, event):
         """Handle delete route button."""
@@ -120,7 +267,7 @@ class RoutingPanel(wx.Panel):
             )
             return
         
-        destination = self.route_list.GetItemText(index, 0)
+        destination = self.route_list.routes[index].get('destination', '')
         
         # Confirm deletion
         result = wx.MessageBox(
@@ -221,9 +368,7 @@ class AddRouteDialog(wx.Dialog):
             "• Use CIDR notation (e.g., 24) or dotted decimal (255.255.255.0)"
         )
         help_label = wx.StaticText(panel, label=help_text)
-        font = help_label.GetFont()
-        font.SetPointSize(font.GetPointSize() - 1)
-        help_label.SetFont(font)
+        help_label.SetFont(_get_small_font(help_label))
         main_sizer.Add(help_label, 0, wx.ALL, 10)
         
         # Buttons
@@ -240,6 +385,13 @@ class AddRouteDialog(wx.Dialog):
         
         panel.SetSizer(main_sizer)
     
+    def reset(self):
+        """Clear the fields so the dialog can add another route."""
+        self.dest_text.Clear()
+        self.gateway_text.Clear()
+        self.netmask_text.Clear()
+        self.dest_text.SetFocus()
+    
     def on_add(self, event):
         """Handle add button."""
         destination = self.dest_text.GetValue().strip()
@@ -3,6 +3,103 @@
 import wx
 import logging
 import threading
+import time
+
+
+def _signal_int(network):
+    """
+    Get the signal strength of a scan result as a number.
+    
+    Args:
+        network: Scan result dictionary
+    
+    Returns:
+        Signal in dBm, or a very low value if it cannot be parsed
+    """
+    # ifconfig reports signal:noise, e.g. "-71:-95"
+    try:
+        return int(network.get('signal', '').split(':', 1)[0])
+    except (AttributeError, ValueError):
+        return -1000
+
+
+def _dedupe_networks(networks):
+    """
+    Keep the strongest result per access point, strongest first.
+    
+    Args:
+        networks: List of scan result dictionaries
+    
+    Returns:
+        List of scan result dictionaries with unique BSSIDs
+    """
+    best = {}
+    for network in networks:
+        # Results without a BSSID cannot be matched up, keep each of them
+        bssid = network.get('bssid') or id(network)
+        previous = best.get(bssid)
+        if previous is None or _signal_int(network) > _signal_int(previous):
+            best[bssid] = network
+    
+    return sorted(best.values(), key=_signal_int, reverse=True)
+
+
+class NetworkListCtrl(wx.ListCtrl):
+    """
+    Virtual list control showing one row per scanned WiFi network.
+    
+    Cell text is read on demand from the scan result dictionaries instead
+    of being copied into the native control item by item.
+    """
+    
+    # (scan result key, header, width) of each column
+    COLUMNS = (
+        ('ssid', "SSID", 200),
+        ('bssid', "BSSID", 150),
+        ('signal', "Signal", 100),
+        ('channel', "Channel", 80),
+        ('security', "Security", 100),
+    )
+    
+    # Dictionary key of each column, indexed by column number
+    _KEYS = tuple(key for key, header, width in COLUMNS)
+    
+    def __init__(self, parent):
+        """
+        Initialize the network list.
+        
+        Args:
+            parent: Parent window
+        """
+        super().__init__(
+            parent,
+            style=wx.LC_REPORT | wx.LC_VIRTUAL | wx.LC_SINGLE_SEL | wx.BORDER_SUNKEN
+        )
+        for key, header, width in self.COLUMNS:
+            self.AppendColumn(header, width=width)
+        self.networks = []
+    
+    def set_networks(self, networks):
+        """
+        Replace the displayed networks.
+        
+        Args:
+            networks: List of scan result dictionaries
+        """
+        self.networks = networks
+        
+        # Resize and repaint as one update
+        self.Freeze()
+        try:
+            self.SetItemCount(len(networks))
+            if networks:
+                self.RefreshItems(0, len(networks) - 1)
+        finally:
+            self.Thaw()
+    
+    def OnGetItemText(self, item, col):
+        """Return the text of a cell for the virtual list."""
+        return self.networks[item].get(self._KEYS[col], '')
 
 
 class WiFiPanel(wx.Panel):
@@ -12,6 +109,12 @@ class WiFiPanel(wx.Panel):
     Provides interface to scan for networks, connect, and disconnect.
     """
     
+    # Milliseconds to wait for further interface changes before querying
+    IFACE_CHANGE_DELAY_MS = 150
+    
+    # Seconds a scan result is shown straight away on the next scan
+    SCAN_CACHE_TTL = 10.0
+    
     def __init__(self, parent, network_manager):
         """
         Initialize the WiFi panel.
@@ -25,6 +128,23 @@ class WiFiPanel(wx.Panel):
         self.logger = logging.getLogger(__name__)
         self.current_iface = None
         
+        # Interfaces with a scan running; the generation is bumped when a
+        # scan's results would no longer match the selected interface
+        self._scans_in_flight = set()
+        self._scan_gen = 0
+        
+        # Last scan result per interface: iface -> (timestamp, networks)
+        self._scan_cache = {}
+        
+        # Interface names currently in iface_choice
+        self._last_ifaces = None
+        
+        # Connect dialog, created on first use and reused afterwards
+        self._connect_dialog = None
+        
+        # Pending debounced interface change
+        self._iface_change_timer = None
+        
         self._create_ui()
         self.refresh()
     
@@ -60,15 +180,7 @@ class WiFiPanel(wx.Panel):
         networks_label = wx.StaticText(self, label="Available Networks:")
         main_sizer.Add(networks_label, 0, wx.ALL, 5)
         
-        self.network_list = wx.ListCtrl(
-            self,
-            style=wx.LC_REPORT | wx.LC_SINGLE_SEL | wx.BORDER_SUNKEN
-        )
-        self.network_list.AppendColumn("SSID", width=200)
-        self.network_list.AppendColumn("BSSID", width=150)
-        self.network_list.AppendColumn("Signal", width=100)
-        self.network_list.AppendColumn("Channel", width=80)
-        self.network_list.AppendColumn("Security", width=100)
+        self.network_list = NetworkListCtrl(self)
         
         main_sizer.Add(self.network_list, 1, wx.EXPAND | wx.ALL, 5)
         
@@ -98,20 +210,7 @@ class WiFiPanel(wx.Panel):
         try:
             # Get WiFi interfaces
             wifi_ifaces = self.network_manager.get_wifi_interfaces()
-            
-            self.iface_choice.Clear()
-            for iface in wifi_ifaces:
-                self.iface_choice.Append(iface)
-            
-            if wifi_ifaces:
-                self.iface_choice.SetSelection(0)
-                self.current_iface = wifi_ifaces[0]
-                self._update_connection_status()
-            else:
-                self.status_text.SetValue("No WiFi interfaces found.")
-                self.current_iface = None
-            
-            self._update_button_states()
+            self.apply_snapshot(wifi_ifaces)
             
         except Exception as e:
             self.logger.error(f"Error refreshing WiFi interfaces: {e}")
@@ -121,13 +220,81 @@ class WiFiPanel(wx.Panel):
                 wx.OK | wx.ICON_ERROR
             )
     
+    def apply_snapshot(self, wifi_ifaces):
+        """
+        Show a WiFi interface list collected elsewhere.
+        
+        Args:
+            wifi_ifaces: List of WiFi interface names
+        """
+        if wifi_ifaces == self._last_ifaces:
+            # Same interfaces, keep the choice and selection as they are
+            self._update_connection_status()
+            return
+        self._last_ifaces = list(wifi_ifaces)
+        
+        # Repaint once after the choice, status and buttons are updated
+        self.Freeze()
+        try:
+            self.iface_choice.Set(wifi_ifaces)
+            
+            if wifi_ifaces:
+                # Stay on the selected interface if it is still present
+                if self.current_iface in wifi_ifaces:
+                    iface = self.current_iface
+                else:
+                    iface = wifi_ifaces[0]
+                self.iface_choice.SetStringSelection(iface)
+                self._set_current_iface(iface)
+                self._update_connection_status()
+            else:
+                self.status_text.SetValue("No WiFi interfaces found.")
+                self._set_current_iface(None)
+            
+            self._update_button_states()
+        finally:
+            self.Thaw()
+    
     def on_interface_changed(self, event):
         """Handle interface selection change."""
         selection = self.iface_choice.GetSelection()
-        if selection != wx.NOT_FOUND:
-            self.current_iface = self.iface_choice.GetString(selection)
-            self._update_connection_status()
-            self._update_button_states()
+        if selection == wx.NOT_FOUND:
+            return
+        
+        # Only query the last interface when stepping through the choice
+        if self._iface_change_timer is not None:
+            self._iface_change_timer.Stop()
+        self._iface_change_timer = wx.CallLater(
+            self.IFACE_CHANGE_DELAY_MS, self._apply_iface_change, selection
+        )
+    
+    def _apply_iface_change(self, selection):
+        """
+        Switch to the interface chosen in iface_choice.
+        
+        Args:
+            selection: Index of the chosen interface
+        """
+        self._iface_change_timer = None
+        if selection >= self.iface_choice.GetCount():
+            # The choice was rebuilt in the meantime
+            return
+        
+        self._set_current_iface(self.iface_choice.GetString(selection))
+        self._update_connection_status()
+        self._update_button_states()
+    
+    def _set_current_iface(self, iface):
+        """
+        Change the selected WiFi interface.
+        
+        Args:
+            iface: Interface name, or None
+        """
+        if iface != self.current_iface:
+            # Results of a running scan belong to the previous interface
+            self._scan_gen += 1
+        self.current_iface = iface
     
     def _update_connection_status(self):
         """Update the connection status display."""
@@ -166,48 +333,78 @@ class WiFiPanel(wx.Panel):
             )
             return
         
-        # Show progress dialog
-        progress = wx.ProgressDialog(
-            "Scanning",
-            "Scanning for WiFi networks...",
-            maximum=100,
-            parent=self,
-            style=wx.PD_APP_MODAL | wx.PD_AUTO_HIDE
-        )
+        iface = self.current_iface
+        if iface in self._scans_in_flight:
+            frame = self.GetTopLevelParent()
+            statusbar = frame.GetStatusBar() if frame else None
+            if statusbar:
+                statusbar.SetStatusText(f"Already scanning on {iface}")
+            return
+        self._scans_in_flight.add(iface)
+        
+        gen = self._scan_gen
+        
+        # A recent result is shown at once and refreshed in the background
+        # without blocking the window
+        cached = self._scan_cache.get(iface)
+        if cached and time.monotonic() - cached[0] < self.SCAN_CACHE_TTL:
+            self.network_list.set_networks(cached[1])
+            progress = None
+        else:
+            # Show progress dialog
+            progress = wx.ProgressDialog(
+                "Scanning",
+                "Scanning for WiFi networks...",
+                maximum=100,
+                parent=self,
+                style=wx.PD_APP_MODAL | wx.PD_AUTO_HIDE
+            )
         
         # Perform scan in background thread
         def scan_thread():
             try:
-                networks = self.network_manager.scan_networks(self.current_iface)
-                wx.CallAfter(self._display_scan_results, networks, progress)
+                # Post-process here so the main thread only updates widgets;
+                # repeated scan passes report the same access point more
+                # than once
+                networks = _dedupe_networks(self.network_manager.scan_networks(iface))
+                wx.CallAfter(self._display_scan_results, networks, progress,
+                             gen, iface)
             except Exception as e:
-                wx.CallAfter(self._handle_scan_error, e, progress)
+                wx.CallAfter(self._handle_scan_error, e, progress, gen, iface)
         
         thread = threading.Thread(target=scan_thread)
         thread.daemon = True
         thread.start()
         
-        progress.Pulse()
+        if progress is not None:
+            progress.Pulse()
     
-    def _display_scan_results(self, networks, progress):
+    def _display_scan_results(self, networks, progress, gen, iface):
         """Display scan results in the list."""
-        progress.Destroy()
+        if progress is not None:
+            progress.Destroy()
+        self._scans_in_flight.discard(iface)
+        
+        # Still valid for its interface even if the user switched away
+        self._scan_cache[iface] = (time.monotonic(), networks)
         
-        self.network_list.DeleteAllItems()
+        if gen != self._scan_gen:
+            self.logger.debug("Discarding scan results for a previous interface")
+            return
         
-        for network in networks:
-            index = self.network_list.GetItemCount()
-            self.network_list.InsertItem(index, network.get('ssid', ''))
-            self.network_list.SetItem(index, 1, network.get('bssid', ''))
-            self.network_list.SetItem(index, 2, network.get('signal', ''))
-            self.network_list.SetItem(index, 3, network.get('channel', ''))
-            self.network_list.SetItem(index, 4, network.get('security', ''))
+        self.network_list.set_networks(networks)
         
         self.logger.info(f"Scan complete: found {len(networks)} networks")
     
-    def _handle_scan_error(self, error, progress):
+    def _handle_scan_error(self, error, progress, gen, iface):
         """Handle scan error."""
-        progress.Destroy()
+        if progress is not None:
+            progress.Destroy()
+        self._scans_in_flight.discard(iface)
+        
+        if gen != self._scan_gen:
+            return
+        
         self.logger.error(f"Scan error: {error}")
         wx.MessageBox(
             f"Error scanning for networks:\n{str(error)}",
@@ -235,14 +432,20 @@ class WiFiPanel(wx.Panel):
             )
             return
         
-        ssid = self.network_list.GetItemText(index, 0)
-        security = self.network_list.GetItemText(index, 4)
+        network = self.network_list.networks[index]
+        ssid = network.get('ssid', '')
+        security = network.get('security', '')
         
         # Show connection dialog
-        dialog = ConnectDialog(self, ssid, security, self.current_iface, self.network_manager)
-        if dialog.ShowModal() == wx.ID_OK:
+        if self._connect_dialog is None:
+            self._connect_dialog = ConnectDialog(
+                self, ssid, security, self.current_iface, self.network_manager
+            )
+        else:
+            self._connect_dialog.reset(ssid, security, self.current_iface)
+        
+        if self._connect_dialog.ShowModal() == wx.ID_OK:
             self._update_connection_status()
-        dialog.Destroy()
     
     def on_disconnect(self, event):
         """Handle disconnect button."""
@@ -312,41 +515,30 @@ class ConnectDialog(wx.Dialog):
         main_sizer = wx.BoxSizer(wx.VERTICAL)
         
         # Network info
-        info_text = f"Network: {self.ssid}\nSecurity: {self.security}"
-        info_label = wx.StaticText(panel, label=info_text)
-        main_sizer.Add(info_label, 0, wx.ALL, 10)
+        self.info_label = wx.StaticText(panel)
+        main_sizer.Add(self.info_label, 0, wx.ALL, 10)
         
         # SSID (editable for hidden networks)
         ssid_sizer = wx.BoxSizer(wx.HORIZONTAL)
         ssid_label = wx.StaticText(panel, label="SSID:", size=(100, -1))
         ssid_sizer.Add(ssid_label, 0, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
-        self.ssid_text = wx.TextCtrl(panel, value=self.ssid)
+        self.ssid_text = wx.TextCtrl(panel)
         ssid_sizer.Add(self.ssid_text, 1, wx.EXPAND | wx.ALL, 5)
         main_sizer.Add(ssid_sizer, 0, wx.EXPAND | wx.ALL, 5)
         
-        # Password
-        if self.security != 'Open':
-            pwd_sizer = wx.BoxSizer(wx.HORIZONTAL)
-            pwd_label = wx.StaticText(panel, label="Password:", size=(100, -1))
-            pwd_sizer.Add(pwd_label, 0, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
-            self.password_text = wx.TextCtrl(panel, style=wx.TE_PASSWORD)
-            pwd_sizer.Add(self.password_text, 1, wx.EXPAND | wx.ALL, 5)
-            main_sizer.Add(pwd_sizer, 0, wx.EXPAND | wx.ALL, 5)
-        else:
-            self.password_text = None
+        # Password, hidden for open networks
+        self.pwd_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        pwd_label = wx.StaticText(panel, label="Password:", size=(100, -1))
+        self.pwd_sizer.Add(pwd_label, 0, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
+        self.password_text = wx.TextCtrl(panel, style=wx.TE_PASSWORD)
+        self.pwd_sizer.Add(self.password_text, 1, wx.EXPAND | wx.ALL, 5)
+        main_sizer.Add(self.pwd_sizer, 0, wx.EXPAND | wx.ALL, 5)
         
         # Security type
         security_sizer = wx.BoxSizer(wx.HORIZONTAL)
         security_label = wx.StaticText(panel, label="Security:", size=(100, -1))
         security_sizer.Add(security_label, 0, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
         self.security_choice = wx.Choice(panel, choices=['Open', 'WEP', 'WPA', 'WPA2'])
-        
-        # Select current security type
-        if self.security in ['Open', 'WEP', 'WPA', 'WPA2']:
-            self.security_choice.SetStringSelection(self.security)
-        else:
-            self.security_choice.SetStringSelection('WPA2')
-        
         security_sizer.Add(self.security_choice, 1, wx.EXPAND | wx.ALL, 5)
         main_sizer.Add(security_sizer, 0, wx.EXPAND | wx.ALL, 5)
         
@@ -362,9 +554,42 @@ class ConnectDialog(wx.Dialog):
         main_sizer.Add(button_sizer, 0, wx.ALIGN_CENTER | wx.ALL, 10)
 
         panel.SetSizer(main_sizer)
+        self.main_sizer = main_sizer
         dialog_sizer = wx.BoxSizer(wx.VERTICAL)
         dialog_sizer.Add(panel, 1, wx.EXPAND)
-        self.SetSizerAndFit(dialog_sizer)
+        self.SetSizer(dialog_sizer)
+        
+        self._show_network()
+    
+    def reset(self, ssid, security, iface):
+        """
+        Prepare the dialog to connect to another network.
+        
+        Args:
+            ssid: Network SSID
+            security: Security type
+            iface: Interface name
+        """
+        self.ssid = ssid
+        self.security = security
+        self.iface = iface
+        self.SetTitle(f"Connect to {ssid}")
+        self._show_network()
+    
+    def _show_network(self):
+        """Fill the fields for the current network."""
+        self.info_label.SetLabel(f"Network: {self.ssid}\nSecurity: {self.security}")
+        self.ssid_text.SetValue(self.ssid)
+        self.password_text.Clear()
+        self.main_sizer.Show(self.pwd_sizer, self.security != 'Open')
+        
+        # Select current security type
+        if self.security in ['Open', 'WEP', 'WPA', 'WPA2']:
+            self.security_choice.SetStringSelection(self.security)
+        else:
+            self.security_choice.SetStringSelection('WPA2')
+        
+        self.Fit()
         self.Layout()
     
     def on_connect(self, event):
@@ -377,7 +602,7 @@ class ConnectDialog(wx.Dialog):
             return
         
         password = None
-        if self.password_text and security != 'Open':
+        if self.password_text.IsShown() and security != 'Open':
             password = self.password_text.GetValue()
             if not password:
                 wx.MessageBox("Password is required for secured networks.", "Validation Error", wx.OK | wx.ICON_WARNING)
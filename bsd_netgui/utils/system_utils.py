@@ -3,6 +3,7 @@
 import os
 import subprocess
 import logging
+import functools
 import ipaddress
 from typing import List, Tuple
 
@@ -57,6 +58,7 @@ def check_root_privileges() -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=1024)
 def validate_ip_address(ip: str) -> bool:
     """
     Validate IPv4 address format.
@@ -80,6 +82,7 @@ def validate_ip_address(ip: str) -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=1024)
 def validate_netmask(netmask: str) -> bool:
     """
     Validate netmask format.
@@ -103,23 +106,14 @@ def validate_netmask(netmask: str) -> bool:
     
     # Check if it's a dotted decimal notation (e.g., "255.255.255.0")
     try:
-        # Convert to IPv4Address and check if it's a valid netmask
-        addr = ipaddress.IPv4Address(netmask)
-        # A valid netmask in binary should be all 1s followed by all 0s
-        # Convert to int and check
-        addr_int = int(addr)
-        # Check if it's a valid netmask pattern
-        # Valid netmasks: 0xFFFFFFFF, 0xFFFFFFFE, 0xFFFFFFFC, etc.
-        # Invalid: 0xFFFFFF00, 0xFF00FFFF, etc.
-        
-        # Count leading ones
-        binary_str = bin(addr_int)[2:].zfill(32)
-        # Should be all 1s followed by all 0s
-        if '01' in binary_str:
-            return False
-        return True
+        addr_int = int(ipaddress.IPv4Address(netmask))
     except (ipaddress.AddressValueError, ValueError):
         return False
+    
+    # A valid netmask in binary is all 1s followed by all 0s, so its
+    # inverse (the host bits) plus one must be a power of two
+    host_bits = addr_int ^ 0xFFFFFFFF
+    return host_bits & (host_bits + 1) == 0
 
 
 def setup_logging(log_file: str = "/var/log/bsd-netgui.log", level: int = logging.INFO):
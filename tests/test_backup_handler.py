@@ -47,6 +47,7 @@ class TestBackupMetadata(unittest.TestCase):
         self.assertEqual(metadata.timestamp, '2025-12-15T10:00:00')
         self.assertEqual(metadata.method, 'zfs')
         self.assertEqual(metadata.reason, 'Test')
+        self.assertEqual(metadata.backup_id, 'tank@netgui-20251215')
 
 
 class TestBackupHandler(unittest.TestCase):
@@ -139,6 +140,24 @@ class TestBackupHandler(unittest.TestCase):
         
         handler.CONFIG_FILES = original_files
     
+    def test_list_backups_backup_id(self):
+        """Test that listed file backups carry their directory as ID."""
+        handler = BackupHandler(self.backup_dir)
+        
+        # Override CONFIG_FILES
+        original_files = handler.CONFIG_FILES
+        handler.CONFIG_FILES = [
+            os.path.join(self.config_dir, 'rc.conf')
+        ]
+        
+        backup_id = handler._create_file_backup("Test backup")
+        backups = handler.list_backups()
+        
+        self.assertEqual(backups[0].backup_id, backup_id)
+        self.assertTrue(handler.delete_backup(backups[0].backup_id))
+        
+        handler.CONFIG_FILES = original_files
+    
     def test_restore_file_backup(self):
         """Test restoring from a file backup."""
         handler = BackupHandler(self.backup_dir)
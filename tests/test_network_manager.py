@@ -0,0 +1,93 @@
+"""Tests for network manager."""
+
+import unittest
+from bsd_netgui.backend.network_manager import NetworkManager, IfaceRow
+
+
+class FakeInterfaceHandler:
+    """Interface handler that counts queries instead of running ifconfig."""
+    
+    def __init__(self):
+        """Start with one interface that is up."""
+        self.calls = 0
+        self.status = 'UP'
+    
+    def list_interfaces(self):
+        """List the interface and count the query."""
+        self.calls += 1
+        return [{'name': 'em0', 'status': self.status, 'mtu': 1500}]
+    
+    def disable_interface(self, iface):
+        """Bring the interface down."""
+        self.status = 'DOWN'
+        return True
+
+
+class TestInterfaceCache(unittest.TestCase):
+    """Test cases for the NetworkManager interface cache."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        NetworkManager._instance = None
+        self.manager = NetworkManager()
+        self.handler = FakeInterfaceHandler()
+        self.manager.interface_handler = self.handler
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        NetworkManager._instance = None
+    
+    def test_rows(self):
+        """Test that listings are returned as IfaceRow tuples."""
+        rows = self.manager.list_interfaces()
+        self.assertEqual(rows, [IfaceRow('em0', 'UP', '', '', '1500', '')])
+    
+    def test_max_age_reuses_listing(self):
+        """Test that a recent listing is reused within max_age."""
+        self.manager.list_interfaces(max_age=60)
+        self.manager.list_interfaces(max_age=60)
+        self.assertEqual(self.handler.calls, 1)
+    
+    def test_zero_max_age_queries(self):
+        """Test that max_age=0 always queries the system."""
+        self.manager.list_interfaces()
+        self.manager.list_interfaces()
+        self.assertEqual(self.handler.calls, 2)
+    
+    def test_invalidate(self):
+        """Test that invalidating forces a new query."""
+        self.manager.list_interfaces(max_age=60)
+        self.manager.invalidate_interface_cache()
+        self.manager.list_interfaces(max_age=60)
+        self.assertEqual(self.handler.calls, 2)
+    
+    def test_change_invalidates(self):
+        """Test that changing an interface drops the cached listing."""
+        self.manager.list_interfaces(max_age=60)
+        self.assertTrue(self.manager.disable_interface('em0'))
+        
+        rows = self.manager.list_interfaces(max_age=60)
+        self.assertEqual(rows[0].status, 'DOWN')
+    
+    def test_listing_during_invalidation_not_cached(self):
+        """Test that a listing overtaken by an invalidation is not cached."""
+        handler = self.handler
+        manager = self.manager
+        
+        class RacingHandler(FakeInterfaceHandler):
+            def list_interfaces(self):
+                """List, then invalidate as a concurrent change would."""
+                result = handler.list_interfaces()
+                manager.invalidate_interface_cache()
+                return result
+        
+        manager.interface_handler = RacingHandler()
+        manager.list_interfaces(max_age=60)
+        
+        manager.interface_handler = handler
+        manager.list_interfaces(max_age=60)
+        self.assertEqual(handler.calls, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
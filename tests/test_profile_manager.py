@@ -0,0 +1,181 @@
+"""Tests for profile manager."""
+
+import unittest
+import tempfile
+import os
+import json
+import shutil
+from pathlib import Path
+from bsd_netgui.backend.profile_manager import ProfileManager, NetworkProfile
+
+
+class TestProfileManager(unittest.TestCase):
+    """Test cases for ProfileManager."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_dir = tempfile.mkdtemp()
+        self.profiles_dir = Path(self.test_dir) / 'profiles'
+        self.manager = ProfileManager(
+            rc_conf_path=os.path.join(self.test_dir, 'rc.conf'),
+            wpa_conf_path=os.path.join(self.test_dir, 'wpa_supplicant.conf'),
+            profiles_dir=str(self.profiles_dir)
+        )
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.test_dir)
+    
+    def _make_profile(self, name, interface='em0'):
+        """Create a profile for testing."""
+        profile = NetworkProfile()
+        profile.name = name
+        profile.interface = interface
+        return profile
+    
+    def test_save_and_load(self):
+        """Test saving and loading profiles."""
+        self.assertTrue(self.manager.save_profile(self._make_profile('Home')))
+        self.assertTrue(self.manager.load_profiles())
+        
+        profile = self.manager.get_profile('Home')
+        self.assertIsNotNone(profile)
+        self.assertEqual(profile.interface, 'em0')
+    
+    def test_load_reuses_unchanged_profiles(self):
+        """Test that unchanged profile files are not parsed again."""
+        self.manager.save_profile(self._make_profile('Home'))
+        self.manager.load_profiles()
+        first = self.manager.get_profile('Home')
+        
+        self.manager.load_profiles()
+        self.assertIs(self.manager.get_profile('Home'), first)
+    
+    def test_load_rereads_modified_profiles(self):
+        """Test that modified profile files are parsed again."""
+        self.manager.save_profile(self._make_profile('Home'))
+        self.manager.load_profiles()
+        
+        profile_file = self.profiles_dir / 'home.json'
+        data = json.loads(profile_file.read_text())
+        data['interface'] = 'igb0'
+        profile_file.write_text(json.dumps(data))
+        
+        # Make sure the change is visible even on coarse timestamps
+        mtime_ns = profile_file.stat().st_mtime_ns + 1000000000
+        os.utime(profile_file, ns=(mtime_ns, mtime_ns))
+        
+        self.manager.load_profiles()
+        self.assertEqual(self.manager.get_profile('Home').interface, 'igb0')
+    
+    def test_load_drops_deleted_profiles(self):
+        """Test that removed profile files disappear on reload."""
+        self.manager.save_profile(self._make_profile('Home'))
+        self.manager.save_profile(self._make_profile('Work'))
+        self.manager.load_profiles()
+        self.assertEqual(len(self.manager.list_profiles()), 2)
+        
+        (self.profiles_dir / 'work.json').unlink()
+        self.manager.load_profiles()
+        
+        self.assertEqual(len(self.manager.list_profiles()), 1)
+        self.assertIsNone(self.manager.get_profile('Work'))
+    
+    def test_get_profile_after_delete(self):
+        """Test that deleted profiles can no longer be looked up."""
+        self.manager.save_profile(self._make_profile('Home'))
+        self.manager.save_profile(self._make_profile('Work'))
+        self.manager.load_profiles()
+        
+        self.assertTrue(self.manager.delete_profile('Work'))
+        self.assertIsNone(self.manager.get_profile('Work'))
+        self.assertIsNotNone(self.manager.get_profile('Home'))
+    
+    def test_rename_profile(self):
+        """Test renaming a saved profile."""
+        self.manager.save_profile(self._make_profile('Home'))
+        self.manager.load_profiles()
+        
+        renamed = self._make_profile('Office', interface='igb0')
+        self.assertTrue(self.manager.rename_profile('Home', renamed))
+        
+        self.assertFalse((self.profiles_dir / 'home.json').exists())
+        self.assertTrue((self.profiles_dir / 'office.json').exists())
+        
+        self.manager.load_profiles()
+        self.assertIsNone(self.manager.get_profile('Home'))
+        self.assertEqual(self.manager.get_profile('Office').interface, 'igb0')
+    
+    def test_rename_profile_refuses_existing_name(self):
+        """Test that renaming onto another saved profile fails."""
+        self.manager.save_profile(self._make_profile('Home'))
+        self.manager.save_profile(self._make_profile('Office', interface='igb0'))
+        self.manager.load_profiles()
+        
+        self.assertFalse(self.manager.rename_profile('Home', self._make_profile('Office')))
+        
+        self.manager.load_profiles()
+        self.assertIsNotNone(self.manager.get_profile('Home'))
+        self.assertEqual(self.manager.get_profile('Office').interface, 'igb0')
+    
+    def test_rename_profile_failure_leaves_no_temp_file(self):
+        """Test that a failed rename cleans up its temporary file."""
+        self.manager.save_profile(self._make_profile('Home'))
+        self.manager.load_profiles()
+        
+        renamed = self._make_profile('Office')
+        renamed.config = {'bad': object()}
+        self.assertFalse(self.manager.rename_profile('Home', renamed))
+        
+        self.assertEqual([p.name for p in self.profiles_dir.iterdir()], ['home.json'])
+    
+    def test_rename_profile_changing_case(self):
+        """Test renaming a profile to a name stored in the same file."""
+        self.manager.save_profile(self._make_profile('Home'))
+        self.manager.load_profiles()
+        
+        self.assertTrue(self.manager.rename_profile('Home', self._make_profile('HOME')))
+        self.assertEqual([p.name for p in self.profiles_dir.iterdir()], ['home.json'])
+        
+        self.manager.load_profiles()
+        self.assertIsNotNone(self.manager.get_profile('HOME'))
+    
+    def test_export_import_roundtrip(self):
+        """Test exporting a profile and importing it again."""
+        profile = self._make_profile('Home')
+        profile.config = {'dhcp': False, 'ip': '192.168.1.10'}
+        export_path = os.path.join(self.test_dir, 'export.json')
+        
+        self.assertTrue(self.manager.export_profile(profile, export_path))
+        imported = self.manager.import_profile(export_path)
+        
+        self.assertEqual(imported.to_dict(), profile.to_dict())
+    
+    def test_import_invalid_file(self):
+        """Test importing a file that is not JSON."""
+        import_path = os.path.join(self.test_dir, 'broken.json')
+        with open(import_path, 'w') as f:
+            f.write('{not json')
+        
+        self.assertIsNone(self.manager.import_profile(import_path))
+    
+    def test_available_templates(self):
+        """Test listing the built-in templates."""
+        templates = ProfileManager.get_available_templates()
+        self.assertEqual(templates, list(ProfileManager.TEMPLATES))
+        
+        # Callers get their own copy of the cached list
+        templates.append('custom')
+        self.assertNotIn('custom', ProfileManager.get_available_templates())
+    
+    def test_load_ignores_non_json_files(self):
+        """Test that other files in the profiles directory are skipped."""
+        self.manager.save_profile(self._make_profile('Home'))
+        (self.profiles_dir / 'notes.txt').write_text('not a profile')
+        
+        self.manager.load_profiles()
+        self.assertEqual(len(self.manager.list_profiles()), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+"""Tests for routing socket monitor."""
+
+import struct
+import unittest
+from bsd_netgui.backend.route_monitor import RouteMonitor
+
+# rt_msghdr message types that do not concern interfaces
+RTM_ADD = 0x1
+RTM_DELETE = 0x2
+RTM_GET = 0x4
+
+
+def make_message(msg_type, msglen=None, payload=b'\0' * 12):
+    """Build a routing message with the given type and length field."""
+    body_len = 4 + len(payload)
+    if msglen is None:
+        msglen = body_len
+    return struct.pack("=HBB", msglen, 5, msg_type) + payload
+
+
+class TestIsInterfaceEvent(unittest.TestCase):
+    """Test cases for RouteMonitor.is_interface_event."""
+    
+    def test_interface_events(self):
+        """Test that address, link and announce messages are accepted."""
+        for msg_type in (RouteMonitor.RTM_NEWADDR, RouteMonitor.RTM_DELADDR,
+                         RouteMonitor.RTM_IFINFO, RouteMonitor.RTM_IFANNOUNCE):
+            with self.subTest(msg_type=msg_type):
+                self.assertTrue(RouteMonitor.is_interface_event(make_message(msg_type)))
+    
+    def test_other_events(self):
+        """Test that route table messages are ignored."""
+        for msg_type in (RTM_ADD, RTM_DELETE, RTM_GET):
+            with self.subTest(msg_type=msg_type):
+                self.assertFalse(RouteMonitor.is_interface_event(make_message(msg_type)))
+    
+    def test_short_buffer(self):
+        """Test that buffers shorter than the header are ignored."""
+        data = make_message(RouteMonitor.RTM_IFINFO)
+        for size in range(4):
+            with self.subTest(size=size):
+                self.assertFalse(RouteMonitor.is_interface_event(data[:size]))
+    
+    def test_truncated_message(self):
+        """Test that messages longer than the data read are ignored."""
+        data = make_message(RouteMonitor.RTM_IFINFO, msglen=64)
+        self.assertFalse(RouteMonitor.is_interface_event(data))
+    
+    def test_bogus_length(self):
+        """Test that a length smaller than the header is ignored."""
+        data = make_message(RouteMonitor.RTM_IFINFO, msglen=2)
+        self.assertFalse(RouteMonitor.is_interface_event(data))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -188,6 +188,19 @@ network={
         self.assertEqual(len(handler.networks), 1)
         self.assertEqual(handler.networks[0].ssid, "Network2")
     
+    def test_remove_network_in_place(self):
+        """Test that removal mutates the list and drops duplicate SSIDs."""
+        handler = WPAConfHandler(self.wpa_conf_path)
+        handler.add_network("Dup", "password1")
+        handler.add_network("Keep", "password2")
+        handler.add_network("Dup", "password3")
+        networks = handler.networks
+        
+        self.assertTrue(handler.remove_network("Dup"))
+        self.assertIs(handler.networks, networks)
+        self.assertEqual([n.ssid for n in handler.networks], ["Keep"])
+        self.assertFalse(handler.remove_network("Dup"))
+    
     def test_update_network(self):
         """Test updating a network."""
         content = """network={